@@ -1,9 +1,13 @@
 # api/engines.py
 """Engine capabilities API endpoints."""
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Tuple
 
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request
+from pydantic import BaseModel, ConfigDict
+
+from api.http_cache import cached_json_response, make_etag
 from config import Settings, get_settings
 from engines.registry import PROVIDERS, get_available_engines
 
@@ -13,6 +17,8 @@ router = APIRouter(prefix="/api/engines", tags=["engines"])
 
 class EngineCapabilities(BaseModel):
     """Engine capabilities."""
+    model_config = ConfigDict(frozen=True)
+
     supports_initial_prompt: bool = False
     supports_timestamps: bool = True
     supports_word_timestamps: bool = True
@@ -20,6 +26,8 @@ class EngineCapabilities(BaseModel):
 
 class EngineInfo(BaseModel):
     """Engine information with models."""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     models: List[str]
@@ -28,16 +36,25 @@ class EngineInfo(BaseModel):
 
 class EnginesResponse(BaseModel):
     """Response with list of engines."""
+    model_config = ConfigDict(frozen=True)
+
     engines: List[EngineInfo]
 
 
 class EngineCapabilitiesResponse(BaseModel):
     """Response model for engine capabilities."""
+    model_config = ConfigDict(frozen=True)
+
     name: str
     display_name: str
     capabilities: EngineCapabilities
 
 
+class EngineDetailsResponse(EngineCapabilitiesResponse):
+    """Response model for engine models and capabilities combined."""
+    models: List[str]
+
+
 # Capabilities for each engine
 ENGINE_CAPABILITIES = {
     "mlx-whisper": EngineCapabilities(
@@ -68,43 +85,89 @@ ENGINE_CAPABILITIES = {
 }
 
 
+def _with_etag(body: bytes) -> Tuple[bytes, str]:
+    """Pair serialized JSON with its ETag."""
+    return body, make_etag(body)
+
+
+# Capabilities responses are static, so serialize them once at import
+_CAPABILITIES_JSON: Dict[str, Tuple[bytes, str]] = {
+    engine_name: _with_etag(orjson.dumps(
+        EngineCapabilitiesResponse(
+            name=engine_name,
+            display_name=provider["name"],
+            capabilities=ENGINE_CAPABILITIES.get(engine_name, EngineCapabilities()),
+        ).model_dump()
+    ))
+    for engine_name, provider in PROVIDERS.items()
+}
+
+_DETAILS_JSON: Dict[str, Tuple[bytes, str]] = {
+    engine_name: _with_etag(orjson.dumps(
+        EngineDetailsResponse(
+            name=engine_name,
+            display_name=provider["name"],
+            capabilities=ENGINE_CAPABILITIES.get(engine_name, EngineCapabilities()),
+            models=provider["models"],
+        ).model_dump()
+    ))
+    for engine_name, provider in PROVIDERS.items()
+}
+
+# Settings fields holding API keys that gate engine availability
+_KEY_FIELDS = tuple(
+    provider["key_field"] for provider in PROVIDERS.values() if provider["key_field"]
+)
+
+
+@lru_cache(maxsize=32)
+def _engines_json(configured_keys: FrozenSet[str]) -> Tuple[bytes, str]:
+    """Serialized engines list (and ETag) for a given set of configured API keys."""
+    engines = get_available_engines({key: True for key in configured_keys})
+    return _with_etag(orjson.dumps(
+        EnginesResponse.model_construct(
+            engines=[EngineInfo.model_construct(**e) for e in engines]
+        ).model_dump()
+    ))
+
+
 @router.get("", response_model=EnginesResponse)
-async def list_engines(settings: Settings = Depends(get_settings)):
+async def list_engines(request: Request, settings: Settings = Depends(get_settings)):
     """List all available transcription engines with their models.
 
     Only returns engines that are properly configured (have API keys if required).
     """
-    config = {
-        "assemblyai_api_key": settings.assemblyai_api_key,
-        "deepgram_api_key": settings.deepgram_api_key,
-        "elevenlabs_api_key": settings.elevenlabs_api_key,
-        "yandex_api_key": settings.yandex_api_key,
-    }
+    configured_keys = frozenset(key for key in _KEY_FIELDS if getattr(settings, key))
+    body, etag = _engines_json(configured_keys)
+    return cached_json_response(request, body, etag)
+
 
-    engines = get_available_engines(config)
-    return EnginesResponse(engines=[EngineInfo(**e) for e in engines])
+@router.get("/{engine_id}/info", response_model=EngineDetailsResponse)
+async def get_engine_details(engine_id: str, request: Request):
+    """Get models and capabilities for a specific engine in one response."""
+    cached = _DETAILS_JSON.get(engine_id)
+    if cached is None:
+        raise HTTPException(status_code=404, detail=f"Engine '{engine_id}' not found")
 
+    body, etag = cached
+    return cached_json_response(request, body, etag)
 
-@router.get("/{engine_id}/models", response_model=List[str])
+
+@router.get("/{engine_id}/models", response_model=List[str], deprecated=True)
 async def get_engine_models(engine_id: str):
-    """Get available models for a specific engine."""
+    """Get available models for a specific engine. Use /{engine_id}/info instead."""
     if engine_id not in PROVIDERS:
         raise HTTPException(status_code=404, detail=f"Engine '{engine_id}' not found")
 
     return PROVIDERS[engine_id]["models"]
 
 
-@router.get("/{engine_name}/capabilities", response_model=EngineCapabilitiesResponse)
-async def get_engine_capabilities(engine_name: str):
-    """Get capabilities for a specific engine."""
-    if engine_name not in PROVIDERS:
+@router.get("/{engine_name}/capabilities", response_model=EngineCapabilitiesResponse, deprecated=True)
+async def get_engine_capabilities(engine_name: str, request: Request):
+    """Get capabilities for a specific engine. Use /{engine_name}/info instead."""
+    cached = _CAPABILITIES_JSON.get(engine_name)
+    if cached is None:
         raise HTTPException(status_code=404, detail=f"Engine '{engine_name}' not found")
 
-    provider = PROVIDERS[engine_name]
-    capabilities = ENGINE_CAPABILITIES.get(engine_name, EngineCapabilities())
-
-    return EngineCapabilitiesResponse(
-        name=engine_name,
-        display_name=provider["name"],
-        capabilities=capabilities,
-    )
+    body, etag = cached
+    return cached_json_response(request, body, etag)
@@ -0,0 +1,49 @@
+# api/http_cache.py
+"""Helpers for ETag-based conditional JSON responses."""
+import hashlib
+from pathlib import Path
+
+from fastapi import Request, Response
+from fastapi.responses import FileResponse
+
+
+def make_etag(body: bytes) -> str:
+    """Build a strong ETag from response bytes."""
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the client's If-None-Match already covers this ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag in candidates or "*" in candidates
+
+
+def cached_json_response(
+    request: Request,
+    body: bytes,
+    etag: str,
+    max_age: int = 60,
+) -> Response:
+    """Return pre-serialized JSON, or 304 if the client has a fresh copy."""
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+def cached_file_response(
+    request: Request,
+    path: Path,
+    media_type: str,
+    max_age: int = 5,
+) -> Response:
+    """Serve a file with an mtime/size ETag, or 304 if the client has a fresh copy."""
+    stat = path.stat()
+    etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+    headers = {"ETag": etag, "Cache-Control": f"private, max-age={max_age}"}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(path, media_type=media_type, headers=headers, stat_result=stat)
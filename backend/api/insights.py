@@ -1,17 +1,37 @@
 # api/insights.py
 """AI Insights API endpoints."""
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Request, Response
 from fastapi.responses import FileResponse
-from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import Session, load_only
 from pathlib import Path
 from datetime import datetime
 
-from config import get_settings
-from models import get_db, Transcription, TranscriptionStatus, LLMOperation, LLMOperationStatus, LLMOperationType
-from services.insight_template_service import InsightTemplateService
-from services.insight_service import InsightService
+from api.http_cache import cached_json_response, make_etag
+from config import MAX_ERROR_MESSAGE_LENGTH, Settings, get_settings
+from models import (
+    get_db,
+    AsyncSessionLocal,
+    SessionLocal,
+    Transcription,
+    TranscriptionStatus,
+    LLMOperation,
+    LLMOperationStatus,
+    LLMOperationType,
+)
+from services.insight_template_service import InsightTemplateService, get_insight_template_service
+from services.insight_service import (
+    SOURCE_CACHE_TTL,
+    InsightService,
+    get_cached_sources_json,
+    get_insight_service,
+)
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/insights", tags=["ai-insights"])
 
@@ -19,6 +39,8 @@ router = APIRouter(prefix="/api/insights", tags=["ai-insights"])
 # Response models
 class InsightSectionResponse(BaseModel):
     """Insight section response."""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     title: str
     description: str
@@ -26,6 +48,8 @@ class InsightSectionResponse(BaseModel):
 
 class InsightTemplateResponse(BaseModel):
     """Insight template response model."""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     description: str
@@ -49,6 +73,8 @@ class GenerateInsightsRequest(BaseModel):
 
 class InsightsMetadataResponse(BaseModel):
     """Insights metadata response."""
+    model_config = ConfigDict(frozen=True)
+
     template_id: str
     template_name: str
     created_at: str
@@ -56,75 +82,159 @@ class InsightsMetadataResponse(BaseModel):
 
 class SourceAvailabilityResponse(BaseModel):
     """Source availability response."""
+    model_config = ConfigDict(frozen=True)
+
     original: bool
     cleaned: bool
 
 
+# Async dependencies so FastAPI resolves the shared services without a threadpool hop
+async def _template_service() -> InsightTemplateService:
+    """Dependency for the shared insight template service."""
+    return get_insight_template_service()
+
+
+async def _insight_service() -> InsightService:
+    """Dependency for the shared insight service."""
+    return get_insight_service()
+
+
+# Template list/detail bodies and ETags, keyed by template service cache generation
+# and template ID (None for the full list)
+_template_json_cache: Dict[Tuple[int, Optional[str]], Tuple[bytes, str]] = {}
+
+
+def _cache_template_json(generation: int, key: Optional[str], body: bytes) -> Tuple[bytes, str]:
+    """Store a template response body, evicting entries from older generations."""
+    if any(cached_generation != generation for cached_generation, _ in _template_json_cache):
+        _template_json_cache.clear()
+    _template_json_cache[(generation, key)] = (body, make_etag(body))
+    return _template_json_cache[(generation, key)]
+
+
 # Template endpoints
 @router.get("/templates", response_model=List[InsightTemplateResponse])
-async def list_insight_templates():
+async def list_insight_templates(
+    request: Request,
+    service: InsightTemplateService = Depends(_template_service),
+):
     """List all available insight templates."""
-    service = InsightTemplateService()
-    templates = service.list_templates()
-    return [
-        InsightTemplateResponse(
-            id=t.id,
-            name=t.name,
-            description=t.description,
-            include_mindmap=t.include_mindmap,
-            sections=[
-                InsightSectionResponse(
-                    id=s["id"],
-                    title=s["title"],
-                    description=s["description"]
-                )
-                for s in t.sections
-            ],
-            temperature=t.temperature,
-        )
-        for t in templates
-    ]
+    generation = service.generation
+
+    cached = _template_json_cache.get((generation, None))
+    if cached is None:
+        body = b"[" + b",".join(t.response_json for t in service.iter_templates()) + b"]"
+        cached = _cache_template_json(generation, None, body)
+    body, etag = cached
+    return cached_json_response(request, body, etag)
 
 
 @router.get("/templates/{template_id}", response_model=InsightTemplateDetailResponse)
-async def get_insight_template(template_id: str):
+async def get_insight_template(
+    template_id: str,
+    request: Request,
+    service: InsightTemplateService = Depends(_template_service),
+):
     """Get a specific insight template by ID."""
-    service = InsightTemplateService()
     template = service.get_template(template_id)
     if not template:
         raise HTTPException(status_code=404, detail="Insight template not found")
-    return InsightTemplateDetailResponse(
-        id=template.id,
-        name=template.name,
-        description=template.description,
-        include_mindmap=template.include_mindmap,
-        sections=[
-            InsightSectionResponse(
-                id=s["id"],
-                title=s["title"],
-                description=s["description"]
-            )
-            for s in template.sections
-        ],
-        temperature=template.temperature,
-        system_prompt=template.system_prompt,
-    )
+
+    cached = _template_json_cache.get((service.generation, template_id))
+    if cached is None:
+        cached = _cache_template_json(service.generation, template_id, template.detail_json)
+    body, etag = cached
+    return cached_json_response(request, body, etag)
 
 
 # Insights generation endpoints
+
+# Read-only endpoints only need the output location and original filename.
+# Built once so SQLAlchemy reuses its memoized cache key and compiled form.
+_TRANSCRIPTION_FILES_BY_ID = (
+    select(Transcription)
+    .options(load_only(Transcription.output_dir, Transcription.filename))
+    .where(Transcription.id == bindparam("tid"))
+)
+
+
+def _get_transcription_files(db: Session, transcription_id: str) -> Optional[Transcription]:
+    """Load a transcription with only its output_dir and filename columns."""
+    return db.execute(
+        _TRANSCRIPTION_FILES_BY_ID, {"tid": transcription_id}
+    ).scalar_one_or_none()
+
+
+async def _run_insights(
+    transcription_id: str,
+    template_id: str,
+    source: str,
+    provider: str,
+    model: str,
+    temperature: float,
+):
+    """Background task: generate insights using its own database session."""
+    logger.info(f"Background insights task started for transcription {transcription_id}")
+
+    # Create a new session for background task (request session is closed)
+    bg_db = SessionLocal()
+    try:
+        # Re-fetch transcription in new session
+        bg_transcription = bg_db.get(Transcription, transcription_id)
+
+        if not bg_transcription:
+            raise ValueError(f"Transcription {transcription_id} not found")
+
+        service = get_insight_service()
+        await service.generate_insights(
+            transcription=bg_transcription,
+            template_id=template_id,
+            source=source,
+            provider=provider,
+            model=model,
+            db=bg_db,
+        )
+    except Exception as e:
+        # logger.exception formats the traceback only if a handler emits it
+        logger.exception(
+            "Insights generation failed", extra={"transcription_id": transcription_id}
+        )
+        error_msg = (str(e) or type(e).__name__)[:MAX_ERROR_MESSAGE_LENGTH]
+        # Log failed operation
+        operation = LLMOperation(
+            transcription_id=transcription_id,
+            operation_type=LLMOperationType.INSIGHTS,
+            provider=provider,
+            model=model,
+            template_id=template_id,
+            temperature=temperature,
+            input_tokens=0,
+            output_tokens=0,
+            cost_usd=None,
+            processing_time_seconds=0,
+            status=LLMOperationStatus.FAILED,
+            error_message=error_msg,
+        )
+        bg_db.add(operation)
+        bg_db.commit()
+    finally:
+        bg_db.close()
+
+
 @router.post("/transcriptions/{transcription_id}")
 async def generate_insights(
     transcription_id: str,
     request: GenerateInsightsRequest,
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
+    service: InsightService = Depends(_insight_service),
+    settings: Settings = Depends(get_settings),
 ):
     """Generate AI Insights for a transcription."""
-    # Verify transcription exists and is completed
-    transcription = db.query(Transcription).filter(
-        Transcription.id == transcription_id
-    ).first()
+    preflight = service.preflight(db, transcription_id, request.template_id)
 
+    # Verify transcription exists and is completed
+    transcription = preflight.transcription
     if not transcription:
         raise HTTPException(status_code=404, detail="Transcription not found")
 
@@ -135,83 +245,29 @@ async def generate_insights(
         )
 
     # Verify template exists
-    template_service = InsightTemplateService()
-    template = template_service.get_template(request.template_id)
+    template = preflight.template
     if not template:
         raise HTTPException(status_code=400, detail="Insight template not found")
 
     # Check source availability
-    insight_service = InsightService()
-    sources = insight_service.check_source_available(transcription)
-
-    if request.source == "cleaned" and not sources["cleaned"]:
+    if request.source == "cleaned" and not preflight.sources["cleaned"]:
         raise HTTPException(
             status_code=400,
             detail="Cleaned transcript not available. Use 'original' or run post-processing first."
         )
-    if request.source == "original" and not sources["original"]:
+    if request.source == "original" and not preflight.sources["original"]:
         raise HTTPException(status_code=400, detail="Original transcript not found")
 
-    # Get settings for defaults
-    settings = get_settings()
-    provider = request.provider or settings.insights_provider
-    model = request.model or settings.insights_model
-
-    # Start processing in background
-    async def run_insights():
-        import logging
-        import traceback
-        logger = logging.getLogger(__name__)
-        logger.info(f"Background insights task started for transcription {transcription_id}")
-
-        from models import SessionLocal
-        # Create a new session for background task (request session is closed)
-        bg_db = SessionLocal()
-        try:
-            # Re-fetch transcription in new session
-            bg_transcription = bg_db.query(Transcription).filter(
-                Transcription.id == transcription_id
-            ).first()
-
-            if not bg_transcription:
-                raise ValueError(f"Transcription {transcription_id} not found")
-
-            service = InsightService()
-            await service.generate_insights(
-                transcription=bg_transcription,
-                template_id=request.template_id,
-                source=request.source,
-                provider=request.provider,
-                model=request.model,
-                db=bg_db,
-            )
-        except Exception as e:
-            # Get full error details
-            error_msg = str(e) or repr(e) or type(e).__name__
-            full_traceback = traceback.format_exc()
-            logger.error(f"Insights generation failed: {error_msg}")
-            logger.error(f"Full traceback:\n{full_traceback}")
-            # Log failed operation
-            operation = LLMOperation(
-                transcription_id=transcription_id,
-                operation_type=LLMOperationType.INSIGHTS,
-                provider=provider,
-                model=model,
-                template_id=request.template_id,
-                temperature=template.temperature,
-                input_tokens=0,
-                output_tokens=0,
-                cost_usd=None,
-                processing_time_seconds=0,
-                status=LLMOperationStatus.FAILED,
-                error_message=error_msg if error_msg else f"Exception: {type(e).__name__}",
-            )
-            bg_db.add(operation)
-            bg_db.commit()
-        finally:
-            bg_db.close()
-
-    background_tasks.add_task(run_insights)
+    # Start processing in background (pass plain values, not request-scoped objects)
+    background_tasks.add_task(
+        _run_insights,
+        transcription_id=transcription_id,
+        template_id=request.template_id,
+        source=request.source,
+        provider=request.provider or settings.insights_provider,
+        model=request.model or settings.insights_model,
+        temperature=template.temperature,
+    )
 
     return {"status": "processing", "transcription_id": transcription_id}
 
@@ -219,29 +275,49 @@ async def generate_insights(
 @router.get("/transcriptions/{transcription_id}/sources")
 async def check_sources(
     transcription_id: str,
+    response: Response,
     db: Session = Depends(get_db),
+    service: InsightService = Depends(_insight_service),
 ):
     """Check which transcript sources are available for insights."""
-    transcription = db.query(Transcription).filter(
-        Transcription.id == transcription_id
-    ).first()
+    transcription = _get_transcription_files(db, transcription_id)
 
     if not transcription:
         raise HTTPException(status_code=404, detail="Transcription not found")
 
-    service = InsightService()
+    # Matches the server-side cache TTL, so polling clients can reuse the answer too
+    response.headers["Cache-Control"] = f"private, max-age={SOURCE_CACHE_TTL}"
     return service.check_source_available(transcription)
 
 
+@router.get("/fast/sources/{transcription_id}", include_in_schema=False)
+async def check_sources_fast(transcription_id: str):
+    """Polling fast path for /sources: serves cached bytes without dependencies."""
+    body = get_cached_sources_json(transcription_id)
+    if body is None:
+        async with AsyncSessionLocal() as db:
+            transcription = (await db.execute(
+                _TRANSCRIPTION_FILES_BY_ID, {"tid": transcription_id}
+            )).scalar_one_or_none()
+        if not transcription:
+            raise HTTPException(status_code=404, detail="Transcription not found")
+        body = get_insight_service().check_source_available_json(transcription)
+
+    return Response(
+        body,
+        media_type="application/json",
+        headers={"Cache-Control": f"private, max-age={SOURCE_CACHE_TTL}"},
+    )
+
+
 @router.get("/transcriptions/{transcription_id}")
 async def list_transcription_insights(
     transcription_id: str,
     db: Session = Depends(get_db),
+    service: InsightService = Depends(_insight_service),
 ):
     """List all generated insights for a transcription."""
-    transcription = db.query(Transcription).filter(
-        Transcription.id == transcription_id
-    ).first()
+    transcription = _get_transcription_files(db, transcription_id)
 
     if not transcription:
         raise HTTPException(status_code=404, detail="Transcription not found")
@@ -249,7 +325,6 @@ async def list_transcription_insights(
     if not transcription.output_dir:
         return []
 
-    service = InsightService()
     return service.list_insights(transcription)
 
 
@@ -258,11 +333,10 @@ async def get_insights(
     transcription_id: str,
     template_id: str,
     db: Session = Depends(get_db),
+    service: InsightService = Depends(_insight_service),
 ):
     """Get generated insights for a specific template."""
-    transcription = db.query(Transcription).filter(
-        Transcription.id == transcription_id
-    ).first()
+    transcription = _get_transcription_files(db, transcription_id)
 
     if not transcription:
         raise HTTPException(status_code=404, detail="Transcription not found")
@@ -270,7 +344,6 @@ async def get_insights(
     if not transcription.output_dir:
         raise HTTPException(status_code=404, detail="Insights not found")
 
-    service = InsightService()
     insights = service.get_insights(transcription, template_id)
 
     if not insights:
@@ -285,14 +358,13 @@ async def download_insights_md(
     transcription_id: str,
     template_id: str,
     db: Session = Depends(get_db),
+    service: InsightService = Depends(_insight_service),
 ):
     """Download insights as markdown file."""
     from fastapi.responses import StreamingResponse
     from io import BytesIO
     
-    transcription = db.query(Transcription).filter(
-        Transcription.id == transcription_id
-    ).first()
+    transcription = _get_transcription_files(db, transcription_id)
 
     if not transcription:
         raise HTTPException(status_code=404, detail="Transcription not found")
@@ -300,7 +372,6 @@ async def download_insights_md(
     if not transcription.output_dir:
         raise HTTPException(status_code=404, detail="Insights not found")
 
-    service = InsightService()
     insights = service.get_insights(transcription, template_id)
 
     if not insights:
@@ -334,14 +405,13 @@ async def download_mindmap_md(
     transcription_id: str,
     template_id: str,
     db: Session = Depends(get_db),
+    service: InsightService = Depends(_insight_service),
 ):
     """Download mindmap as markdown file."""
     from fastapi.responses import StreamingResponse
     from io import BytesIO
     
-    transcription = db.query(Transcription).filter(
-        Transcription.id == transcription_id
-    ).first()
+    transcription = _get_transcription_files(db, transcription_id)
 
     if not transcription:
         raise HTTPException(status_code=404, detail="Transcription not found")
@@ -349,7 +419,6 @@ async def download_mindmap_md(
     if not transcription.output_dir:
         raise HTTPException(status_code=404, detail="Mindmap not found")
 
-    service = InsightService()
     insights = service.get_insights(transcription, template_id)
 
     if not insights or not insights.get('mindmap'):
@@ -0,0 +1,20 @@
+# api/pagination.py
+"""Helpers for keyset pagination over (created_at, id) ordered listings."""
+from datetime import datetime
+from typing import Tuple
+
+from fastapi import HTTPException
+
+
+def encode_keyset_cursor(created_at: datetime, row_id: str) -> str:
+    """Build the cursor that resumes a newest-first listing after this row."""
+    return f"{created_at.isoformat()},{row_id}"
+
+
+def decode_keyset_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Parse a keyset cursor into (created_at, id), or raise 400."""
+    try:
+        created_at, row_id = cursor.split(",", 1)
+        return datetime.fromisoformat(created_at), row_id
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
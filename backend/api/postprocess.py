@@ -1,18 +1,48 @@
 # api/postprocess.py
 """Post-processing API endpoints."""
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+import asyncio
+import logging
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import aiofiles
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Request, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
-
-from config import get_settings
-from models import get_db, Transcription, TranscriptionStatus, LLMOperation, LLMOperationStatus
-from services.template_service import TemplateService
-from services.llm_models_service import LLMModelsService
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+from sqlalchemy.orm.attributes import flag_modified
+
+from api.http_cache import cached_file_response, cached_json_response, make_etag
+from api.pagination import decode_keyset_cursor, encode_keyset_cursor
+from api.transcribe import _regenerate_txt_files
+from config import MAX_ERROR_MESSAGE_LENGTH, get_settings
+from models import (
+    get_async_db,
+    SessionLocal,
+    Transcription,
+    TranscriptionStatus,
+    LLMOperation,
+    LLMOperationStatus,
+)
+from services.template_service import TemplateService, get_template_service
+from services.llm_models_service import LLMModelsService, get_llm_models_service
+from services.json_files import write_json_atomic
 from services.postprocessing_service import PostProcessingService
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api/postprocess", tags=["post-processing"])
 
+# Lifetimes (seconds) of cached read responses; writes through this API clear
+# their namespace, so the TTL only bounds staleness for edits made on disk.
+TEMPLATES_CACHE_TTL = 300
+MODELS_CACHE_TTL = 600
+
 
 # Response models
 class TemplateResponse(BaseModel):
@@ -100,37 +130,143 @@ class SpeakerSuggestionsResponse(BaseModel):
     suggestions: List[SpeakerSuggestionResponse]
 
 
+async def _get_transcription(
+    db: AsyncSession,
+    transcription_id: str,
+    *columns,
+) -> Optional[Transcription]:
+    """Look up a transcription, loading only the given columns besides its ID."""
+    return await db.get(Transcription, transcription_id, options=[load_only(*columns)])
+
+
+async def _template_service() -> TemplateService:
+    """Dependency for the shared template service."""
+    return get_template_service()
+
+
+async def _llm_models_service() -> LLMModelsService:
+    """Dependency for the shared LLM models service."""
+    return get_llm_models_service()
+
+
+# Serialized read responses: (namespace, key) -> (expires_at, body, etag)
+_response_cache: Dict[Tuple[str, Optional[str]], Tuple[float, bytes, str]] = {}
+
+
+def _get_cached_response(namespace: str, key: Optional[str] = None) -> Optional[Tuple[bytes, str]]:
+    """Return a cached response body and ETag if it has not expired."""
+    cached = _response_cache.get((namespace, key))
+    if cached and time.monotonic() < cached[0]:
+        return cached[1], cached[2]
+    return None
+
+
+def _cache_response(namespace: str, key: Optional[str], data, ttl: int) -> Tuple[bytes, str]:
+    """Serialize and cache a response body."""
+    body = orjson.dumps(data)
+    etag = make_etag(body)
+    _response_cache[(namespace, key)] = (time.monotonic() + ttl, body, etag)
+    return body, etag
+
+
+def _clear_cached_responses(namespace: str):
+    """Drop every cached response in a namespace."""
+    for cache_key in [k for k in _response_cache if k[0] == namespace]:
+        del _response_cache[cache_key]
+
+
+# Transcript JSON files are read without blocking the event loop; writes run
+# write_json_atomic in a worker thread
+async def _read_json(path: Path) -> Any:
+    """Read and parse a JSON file."""
+    async with aiofiles.open(path, "rb") as f:
+        return orjson.loads(await f.read())
+
+
+async def _read_json_if_exists(path: Path) -> Optional[Any]:
+    """Read and parse a JSON file, or return None if it does not exist."""
+    try:
+        return await _read_json(path)
+    except FileNotFoundError:
+        return None
+
+
+# (job, transcription_id) -> claimed_at for jobs currently running; the app is a
+# single process, so an in-memory map is enough to turn duplicate submissions away
+_jobs_in_progress: Dict[Tuple[str, str], float] = {}
+
+# A claim older than this is treated as abandoned (e.g. its background task
+# never started); it outlasts the slowest LLM call with all retries
+JOB_CLAIM_TIMEOUT = 60 * 60
+
+
+def _claim_job(job: str, transcription_id: str, detail: str):
+    """Mark a job as running, or raise 409 if it already is."""
+    key = (job, transcription_id)
+    claimed_at = _jobs_in_progress.get(key)
+    if claimed_at is not None and time.monotonic() - claimed_at < JOB_CLAIM_TIMEOUT:
+        raise HTTPException(status_code=409, detail=detail)
+    _jobs_in_progress[key] = time.monotonic()
+
+
+def _release_job(job: str, transcription_id: str):
+    """Mark a job as finished."""
+    _jobs_in_progress.pop((job, transcription_id), None)
+
+
+@contextmanager
+def _exclusive_job(job: str, transcription_id: str, detail: str) -> Iterator[None]:
+    """Run a block as a claimed job, releasing it however the block exits."""
+    _claim_job(job, transcription_id, detail)
+    try:
+        yield
+    finally:
+        _release_job(job, transcription_id)
+
+
 # Template endpoints
 @router.get("/templates", response_model=List[TemplateResponse])
-async def list_templates():
+async def list_templates(
+    request: Request,
+    service: TemplateService = Depends(_template_service),
+):
     """List all available post-processing templates."""
-    service = TemplateService()
-    templates = service.list_templates()
-    return [
-        TemplateResponse(
-            id=t.id,
-            name=t.name,
-            description=t.description,
-            temperature=t.temperature,
-        )
-        for t in templates
-    ]
+    cached = _get_cached_response("templates")
+    if cached is None:
+        cached = _cache_response("templates", None, [
+            {
+                "id": t.id,
+                "name": t.name,
+                "description": t.description,
+                "temperature": t.temperature,
+            }
+            for t in service.list_templates()
+        ], TEMPLATES_CACHE_TTL)
+    body, etag = cached
+    return cached_json_response(request, body, etag)
 
 
 @router.get("/templates/{template_id}", response_model=TemplateDetailResponse)
-async def get_template(template_id: str):
+async def get_template(
+    template_id: str,
+    request: Request,
+    service: TemplateService = Depends(_template_service),
+):
     """Get a specific template by ID."""
-    service = TemplateService()
-    template = service.get_template(template_id)
-    if not template:
-        raise HTTPException(status_code=404, detail="Template not found")
-    return TemplateDetailResponse(
-        id=template.id,
-        name=template.name,
-        description=template.description,
-        temperature=template.temperature,
-        system_prompt=template.system_prompt,
-    )
+    cached = _get_cached_response("templates", template_id)
+    if cached is None:
+        template = service.get_template(template_id)
+        if not template:
+            raise HTTPException(status_code=404, detail="Template not found")
+        cached = _cache_response("templates", template_id, {
+            "id": template.id,
+            "name": template.name,
+            "description": template.description,
+            "temperature": template.temperature,
+            "system_prompt": template.system_prompt,
+        }, TEMPLATES_CACHE_TTL)
+    body, etag = cached
+    return cached_json_response(request, body, etag)
 
 
 class CreateTemplateRequest(BaseModel):
@@ -143,12 +279,13 @@ class CreateTemplateRequest(BaseModel):
 
 
 @router.post("/templates", response_model=TemplateResponse, status_code=201)
-async def create_template(request: CreateTemplateRequest):
+async def create_template(
+    request: CreateTemplateRequest,
+    service: TemplateService = Depends(_template_service),
+):
     """Create a new custom template."""
     from services.template_service import Template
 
-    service = TemplateService()
-
     # Check if template already exists
     if service.get_template(request.id):
         raise HTTPException(status_code=400, detail="Template ID already exists")
@@ -161,6 +298,7 @@ async def create_template(request: CreateTemplateRequest):
         temperature=request.temperature,
     )
     service.create_template(template)
+    _clear_cached_responses("templates")
 
     return TemplateResponse(
         id=template.id,
@@ -171,12 +309,14 @@ async def create_template(request: CreateTemplateRequest):
 
 
 @router.put("/templates/{template_id}", response_model=TemplateResponse)
-async def update_template(template_id: str, request: CreateTemplateRequest):
+async def update_template(
+    template_id: str,
+    request: CreateTemplateRequest,
+    service: TemplateService = Depends(_template_service),
+):
     """Update an existing template."""
     from services.template_service import Template
 
-    service = TemplateService()
-
     existing = service.get_template(template_id)
     if not existing:
         raise HTTPException(status_code=404, detail="Template not found")
@@ -189,6 +329,7 @@ async def update_template(template_id: str, request: CreateTemplateRequest):
         temperature=request.temperature,
     )
     service.update_template(template)
+    _clear_cached_responses("templates")
 
     return TemplateResponse(
         id=template.id,
@@ -199,24 +340,33 @@ async def update_template(template_id: str, request: CreateTemplateRequest):
 
 
 @router.delete("/templates/{template_id}")
-async def delete_template(template_id: str):
+async def delete_template(
+    template_id: str,
+    service: TemplateService = Depends(_template_service),
+):
     """Delete a custom template."""
-    service = TemplateService()
-
     if not service.delete_template(template_id):
         raise HTTPException(
             status_code=400,
             detail="Cannot delete: template not found or is a default template"
         )
+    _clear_cached_responses("templates")
 
     return {"status": "deleted"}
 
 
 # LLM Models endpoints
 @router.get("/models")
-async def list_llm_models():
+async def list_llm_models(
+    request: Request,
+    service: LLMModelsService = Depends(_llm_models_service),
+):
     """List available LLM models by provider."""
-    service = LLMModelsService()
+    cached = _get_cached_response("models")
+    if cached is not None:
+        body, etag = cached
+        return cached_json_response(request, body, etag)
+
     config = service.get_all_config()
 
     result = {}
@@ -233,30 +383,134 @@ async def list_llm_models():
             ]
         }
 
-    return result
+    body, etag = _cache_response("models", None, result, MODELS_CACHE_TTL)
+    return cached_json_response(request, body, etag)
 
 
 @router.put("/models")
-async def update_llm_models(config: dict):
+async def update_llm_models(
+    config: dict,
+    service: LLMModelsService = Depends(_llm_models_service),
+):
     """Update LLM models configuration."""
-    service = LLMModelsService()
     service.update_config(config)
+    _clear_cached_responses("models")
     return service.get_all_config()
 
 
 # Post-processing endpoints
+async def _run_postprocessing(
+    transcription_id: str,
+    template_id: str,
+    provider: str,
+    model: str,
+):
+    """Background task: clean up a transcript using its own database session.
+
+    Takes only plain values, so it can be scheduled by any runner, not just
+    the request's BackgroundTasks.
+    """
+    logger.info(f"Background task started for transcription {transcription_id}")
+
+    # Create a new session for background task (request session is closed)
+    bg_db = SessionLocal()
+    operation = None
+    start_time = time.time()
+
+    try:
+        # Re-fetch in this session: the row may have been deleted since the request
+        transcription = bg_db.get(
+            Transcription,
+            transcription_id,
+            options=[load_only(
+                Transcription.status,
+                Transcription.output_dir,
+                Transcription.filename,
+                Transcription.initial_prompt,
+            )],
+        )
+        if not transcription:
+            raise ValueError(f"Transcription {transcription_id} not found")
+
+        # Create operation record with PROCESSING status at start
+        operation = LLMOperation(
+            transcription_id=transcription_id,
+            provider=provider,
+            model=model,
+            template_id=template_id,
+            temperature=0.2,
+            input_tokens=0,
+            output_tokens=0,
+            cost_usd=None,
+            processing_time_seconds=0,
+            status=LLMOperationStatus.PROCESSING,
+            error_message=None,
+        )
+        bg_db.add(operation)
+        # Flush assigns the ID, so reading it after commit needs no reload.
+        # This commit is kept so status polling sees the PROCESSING row.
+        bg_db.flush()
+        operation_id = operation.id
+        bg_db.commit()
+        logger.info(f"Created operation {operation_id} with status PROCESSING")
+
+        service = PostProcessingService()
+        await service.process_transcript(
+            transcription=transcription,
+            template_id=template_id,
+            provider=provider,
+            model=model,
+            db=bg_db,
+            existing_operation=operation,  # Pass operation to update instead of create new
+        )
+
+        # Tokens/cost set by the service are committed together with SUCCESS
+        operation.status = LLMOperationStatus.SUCCESS
+        operation.processing_time_seconds = time.time() - start_time
+        bg_db.commit()
+        logger.info(f"Operation {operation_id} completed successfully")
+
+    except Exception as e:
+        logger.exception("Post-processing failed", extra={"transcription_id": transcription_id})
+        error_msg = (str(e) or type(e).__name__)[:MAX_ERROR_MESSAGE_LENGTH]
+
+        # Update existing operation to FAILED or create new if none exists
+        if operation:
+            operation.status = LLMOperationStatus.FAILED
+            operation.error_message = error_msg
+            operation.processing_time_seconds = time.time() - start_time
+        else:
+            operation = LLMOperation(
+                transcription_id=transcription_id,
+                provider=provider,
+                model=model,
+                template_id=template_id,
+                temperature=0.2,
+                input_tokens=0,
+                output_tokens=0,
+                cost_usd=None,
+                processing_time_seconds=time.time() - start_time,
+                status=LLMOperationStatus.FAILED,
+                error_message=error_msg,
+            )
+            bg_db.add(operation)
+        bg_db.commit()
+    finally:
+        bg_db.close()
+        _release_job("postprocess", transcription_id)
+
+
 @router.post("/transcriptions/{transcription_id}")
 async def start_postprocessing(
     transcription_id: str,
     request: PostProcessRequest,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
+    template_service: TemplateService = Depends(_template_service),
 ):
     """Start post-processing for a transcription."""
     # Verify transcription exists and is completed
-    transcription = db.query(Transcription).filter(
-        Transcription.id == transcription_id
-    ).first()
+    transcription = await _get_transcription(db, transcription_id, Transcription.status)
 
     if not transcription:
         raise HTTPException(status_code=404, detail="Transcription not found")
@@ -268,7 +522,6 @@ async def start_postprocessing(
         )
 
     # Verify template exists
-    template_service = TemplateService()
     if not template_service.get_template(request.template_id):
         raise HTTPException(status_code=400, detail="Template not found")
 
@@ -277,100 +530,11 @@ async def start_postprocessing(
     provider = request.provider or settings.postprocessing_provider
     model = request.model or settings.postprocessing_model
 
-    # Extract data needed for background task (session will be closed after request)
-    output_dir = transcription.output_dir
-    filename = transcription.filename
-
-    # Start processing in background
-    async def run_postprocessing():
-        import logging
-        import time
-        logger = logging.getLogger(__name__)
-        logger.info(f"Background task started for transcription {transcription_id}")
-
-        from models import SessionLocal
-        # Create a new session for background task (request session is closed)
-        bg_db = SessionLocal()
-        operation = None
-        start_time = time.time()
-        
-        try:
-            # Create operation record with PROCESSING status at start
-            operation = LLMOperation(
-                transcription_id=transcription_id,
-                provider=provider,
-                model=model,
-                template_id=request.template_id,
-                temperature=0.2,
-                input_tokens=0,
-                output_tokens=0,
-                cost_usd=None,
-                processing_time_seconds=0,
-                status=LLMOperationStatus.PROCESSING,
-                error_message=None,
-            )
-            bg_db.add(operation)
-            bg_db.commit()
-            bg_db.refresh(operation)
-            logger.info(f"Created operation {operation.id} with status PROCESSING")
-            
-            # Re-fetch transcription in new session
-            bg_transcription = bg_db.query(Transcription).filter(
-                Transcription.id == transcription_id
-            ).first()
-
-            if not bg_transcription:
-                raise ValueError(f"Transcription {transcription_id} not found")
-
-            service = PostProcessingService()
-            result = await service.process_transcript(
-                transcription=bg_transcription,
-                template_id=request.template_id,
-                provider=request.provider,
-                model=request.model,
-                db=bg_db,
-                existing_operation=operation,  # Pass operation to update instead of create new
-            )
-            
-            # Update operation to SUCCESS (service already updated tokens/cost)
-            operation.status = LLMOperationStatus.SUCCESS
-            operation.processing_time_seconds = time.time() - start_time
-            bg_db.commit()
-            logger.info(f"Operation {operation.id} completed successfully")
-            
-        except Exception as e:
-            import traceback
-            # Get full error details
-            error_msg = str(e) or repr(e) or type(e).__name__
-            full_traceback = traceback.format_exc()
-            logger.error(f"Post-processing failed: {error_msg}")
-            logger.error(f"Full traceback:\n{full_traceback}")
-            
-            # Update existing operation to FAILED or create new if none exists
-            if operation:
-                operation.status = LLMOperationStatus.FAILED
-                operation.error_message = error_msg if error_msg else f"Exception: {type(e).__name__}"
-                operation.processing_time_seconds = time.time() - start_time
-            else:
-                operation = LLMOperation(
-                    transcription_id=transcription_id,
-                    provider=provider,
-                    model=model,
-                    template_id=request.template_id,
-                    temperature=0.2,
-                    input_tokens=0,
-                    output_tokens=0,
-                    cost_usd=None,
-                    processing_time_seconds=time.time() - start_time,
-                    status=LLMOperationStatus.FAILED,
-                    error_message=error_msg if error_msg else f"Exception: {type(e).__name__}",
-                )
-                bg_db.add(operation)
-            bg_db.commit()
-        finally:
-            bg_db.close()
-
-    background_tasks.add_task(run_postprocessing)
+    # Guard against double submissions spending twice on the LLM
+    _claim_job("postprocess", transcription_id, "Post-processing already in progress")
+    background_tasks.add_task(
+        _run_postprocessing, transcription_id, request.template_id, provider, model
+    )
 
     return {"status": "processing", "transcription_id": transcription_id}
 
@@ -378,15 +542,11 @@ async def start_postprocessing(
 @router.get("/transcriptions/{transcription_id}/cleaned")
 async def get_cleaned_transcript(
     transcription_id: str,
-    db: Session = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get the cleaned transcript for a transcription."""
-    import json
-    from pathlib import Path
-
-    transcription = db.query(Transcription).filter(
-        Transcription.id == transcription_id
-    ).first()
+    transcription = await _get_transcription(db, transcription_id, Transcription.output_dir)
 
     if not transcription:
         raise HTTPException(status_code=404, detail="Transcription not found")
@@ -398,8 +558,8 @@ async def get_cleaned_transcript(
     if not cleaned_path.exists():
         raise HTTPException(status_code=404, detail="Cleaned transcript not found")
 
-    with open(cleaned_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    # Served as stored; the ETag lets polling clients skip unchanged files
+    return cached_file_response(request, cleaned_path, "application/json")
 
 
 # Operation history endpoints
@@ -407,48 +567,65 @@ async def get_cleaned_transcript(
 async def list_operations(
     transcription_id: Optional[str] = None,
     limit: int = 50,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
 ):
-    """List LLM operation history."""
-    query = db.query(LLMOperation).order_by(LLMOperation.created_at.desc())
+    """List LLM operation history, newest first.
+
+    Pages with keyset pagination: pass the X-Next-Cursor header of a full page
+    as ``cursor`` to get the operations that follow it.
+    """
+    query = select(LLMOperation).order_by(
+        LLMOperation.created_at.desc(), LLMOperation.id.desc()
+    )
 
     if transcription_id:
-        query = query.filter(LLMOperation.transcription_id == transcription_id)
-
-    operations = query.limit(limit).all()
-
-    return [
-        OperationHistoryResponse(
-            id=op.id,
-            transcription_id=op.transcription_id,
-            created_at=op.created_at.isoformat(),
-            provider=op.provider,
-            model=op.model,
-            template_id=op.template_id,
-            input_tokens=op.input_tokens,
-            output_tokens=op.output_tokens,
-            cost_usd=op.cost_usd,
-            processing_time_seconds=op.processing_time_seconds,
-            status=op.status.value,
-            error_message=op.error_message,
+        query = query.where(LLMOperation.transcription_id == transcription_id)
+
+    if cursor:
+        query = query.where(
+            tuple_(LLMOperation.created_at, LLMOperation.id) < decode_keyset_cursor(cursor)
         )
-        for op in operations
-    ]
+
+    operations = (await db.scalars(query.limit(limit))).all()
+
+    headers = {}
+    if operations and len(operations) == limit:
+        headers["X-Next-Cursor"] = encode_keyset_cursor(operations[-1].created_at, operations[-1].id)
+
+    # Rows come straight from the database, so plain dicts skip model validation;
+    # response_model above still documents the shape
+    return ORJSONResponse(
+        [
+            {
+                "id": op.id,
+                "transcription_id": op.transcription_id,
+                "created_at": op.created_at.isoformat(),
+                "provider": op.provider,
+                "model": op.model,
+                "template_id": op.template_id,
+                "input_tokens": op.input_tokens,
+                "output_tokens": op.output_tokens,
+                "cost_usd": op.cost_usd,
+                "processing_time_seconds": op.processing_time_seconds,
+                "status": op.status.value,
+                "error_message": op.error_message,
+            }
+            for op in operations
+        ],
+        headers=headers,
+    )
 
 
 # Speaker suggestions endpoints
 @router.get("/transcriptions/{transcription_id}/suggestions")
 async def get_speaker_suggestions(
     transcription_id: str,
-    db: Session = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get speaker name suggestions for a transcription."""
-    import json
-    from pathlib import Path
-
-    transcription = db.query(Transcription).filter(
-        Transcription.id == transcription_id
-    ).first()
+    transcription = await _get_transcription(db, transcription_id, Transcription.output_dir)
 
     if not transcription:
         raise HTTPException(status_code=404, detail="Transcription not found")
@@ -460,24 +637,94 @@ async def get_speaker_suggestions(
     if not suggestions_path.exists():
         raise HTTPException(status_code=404, detail="No speaker suggestions available")
 
-    with open(suggestions_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return cached_file_response(request, suggestions_path, "application/json")
+
+
+async def _run_identify_speakers(transcription_id: str, provider: str, model: str):
+    """Background task: identify speakers using its own database session."""
+    logger.info(f"Identify speakers started for transcription {transcription_id}")
+
+    bg_db = SessionLocal()
+    operation = None
+    start_time = time.time()
+
+    try:
+        transcription = bg_db.get(
+            Transcription,
+            transcription_id,
+            options=[load_only(Transcription.output_dir, Transcription.initial_prompt)],
+        )
+        if not transcription:
+            raise ValueError(f"Transcription {transcription_id} not found")
+
+        operation = LLMOperation(
+            transcription_id=transcription_id,
+            provider=provider,
+            model=model,
+            template_id="identify-speakers",
+            temperature=0.2,
+            input_tokens=0,
+            output_tokens=0,
+            cost_usd=None,
+            processing_time_seconds=0,
+            status=LLMOperationStatus.PROCESSING,
+            error_message=None,
+        )
+        bg_db.add(operation)
+        bg_db.commit()
+
+        service = PostProcessingService()
+        await service.identify_speakers(
+            transcription=transcription,
+            db=bg_db,
+            existing_operation=operation,
+        )
+
+        operation.status = LLMOperationStatus.SUCCESS
+        operation.processing_time_seconds = time.time() - start_time
+        bg_db.commit()
+        logger.info(f"Identify speakers completed for {transcription_id}")
+
+    except Exception as e:
+        logger.exception("Identify speakers failed", extra={"transcription_id": transcription_id})
+        error_msg = (str(e) or type(e).__name__)[:MAX_ERROR_MESSAGE_LENGTH]
+
+        if operation:
+            operation.status = LLMOperationStatus.FAILED
+            operation.error_message = error_msg
+            operation.processing_time_seconds = time.time() - start_time
+        else:
+            operation = LLMOperation(
+                transcription_id=transcription_id,
+                provider=provider,
+                model=model,
+                template_id="identify-speakers",
+                temperature=0.2,
+                input_tokens=0,
+                output_tokens=0,
+                cost_usd=None,
+                processing_time_seconds=time.time() - start_time,
+                status=LLMOperationStatus.FAILED,
+                error_message=error_msg,
+            )
+            bg_db.add(operation)
+        bg_db.commit()
+    finally:
+        bg_db.close()
 
 
 @router.post("/transcriptions/{transcription_id}/identify-speakers")
 async def identify_speakers(
     transcription_id: str,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Identify speakers from transcript context (for cloud-engine transcriptions).
 
     Unlike full post-processing, this only identifies who each speaker is
     without cleaning/modifying the transcript text.
     """
-    transcription = db.query(Transcription).filter(
-        Transcription.id == transcription_id
-    ).first()
+    transcription = await _get_transcription(db, transcription_id, Transcription.status)
 
     if not transcription:
         raise HTTPException(status_code=404, detail="Transcription not found")
@@ -492,84 +739,7 @@ async def identify_speakers(
     provider = settings.postprocessing_provider
     model = settings.postprocessing_model
 
-    async def run_identify_speakers():
-        import logging
-        import time
-        logger = logging.getLogger(__name__)
-        logger.info(f"Identify speakers started for transcription {transcription_id}")
-
-        from models import SessionLocal
-        bg_db = SessionLocal()
-        operation = None
-        start_time = time.time()
-
-        try:
-            operation = LLMOperation(
-                transcription_id=transcription_id,
-                provider=provider,
-                model=model,
-                template_id="identify-speakers",
-                temperature=0.2,
-                input_tokens=0,
-                output_tokens=0,
-                cost_usd=None,
-                processing_time_seconds=0,
-                status=LLMOperationStatus.PROCESSING,
-                error_message=None,
-            )
-            bg_db.add(operation)
-            bg_db.commit()
-            bg_db.refresh(operation)
-
-            bg_transcription = bg_db.query(Transcription).filter(
-                Transcription.id == transcription_id
-            ).first()
-
-            if not bg_transcription:
-                raise ValueError(f"Transcription {transcription_id} not found")
-
-            service = PostProcessingService()
-            await service.identify_speakers(
-                transcription=bg_transcription,
-                db=bg_db,
-                existing_operation=operation,
-            )
-
-            operation.status = LLMOperationStatus.SUCCESS
-            operation.processing_time_seconds = time.time() - start_time
-            bg_db.commit()
-            logger.info(f"Identify speakers completed for {transcription_id}")
-
-        except Exception as e:
-            import traceback
-            error_msg = str(e) or repr(e) or type(e).__name__
-            logger.error(f"Identify speakers failed: {error_msg}")
-            logger.error(traceback.format_exc())
-
-            if operation:
-                operation.status = LLMOperationStatus.FAILED
-                operation.error_message = error_msg
-                operation.processing_time_seconds = time.time() - start_time
-            else:
-                operation = LLMOperation(
-                    transcription_id=transcription_id,
-                    provider=provider,
-                    model=model,
-                    template_id="identify-speakers",
-                    temperature=0.2,
-                    input_tokens=0,
-                    output_tokens=0,
-                    cost_usd=None,
-                    processing_time_seconds=time.time() - start_time,
-                    status=LLMOperationStatus.FAILED,
-                    error_message=error_msg,
-                )
-                bg_db.add(operation)
-            bg_db.commit()
-        finally:
-            bg_db.close()
-
-    background_tasks.add_task(run_identify_speakers)
+    background_tasks.add_task(_run_identify_speakers, transcription_id, provider, model)
 
     return {"status": "processing", "transcription_id": transcription_id}
 
@@ -578,15 +748,13 @@ async def identify_speakers(
 async def apply_speaker_suggestion(
     transcription_id: str,
     speaker_id: str,
-    db: Session = Depends(get_db),
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Apply a speaker name suggestion."""
-    import json
-    from pathlib import Path
-
-    transcription = db.query(Transcription).filter(
-        Transcription.id == transcription_id
-    ).first()
+    transcription = await _get_transcription(
+        db, transcription_id, Transcription.output_dir, Transcription.speaker_names
+    )
 
     if not transcription:
         raise HTTPException(status_code=404, detail="Transcription not found")
@@ -594,84 +762,78 @@ async def apply_speaker_suggestion(
     if not transcription.output_dir:
         raise HTTPException(status_code=404, detail="Transcript not ready")
 
-    output_dir = Path(transcription.output_dir)
-    suggestions_path = output_dir / "speaker_suggestions.json"
+    # Shares the apply-all claim: both read and rewrite the same files
+    with _exclusive_job("apply-suggestions", transcription_id, "Apply already in progress"):
+        output_dir = Path(transcription.output_dir)
+        suggestions_path = output_dir / "speaker_suggestions.json"
 
-    if not suggestions_path.exists():
-        raise HTTPException(status_code=404, detail="No speaker suggestions available")
+        if not suggestions_path.exists():
+            raise HTTPException(status_code=404, detail="No speaker suggestions available")
+
+        # Load suggestions
+        suggestions_data = await _read_json(suggestions_path)
+
+        # Find the suggestion
+        suggestion = None
+        for sug in suggestions_data["suggestions"]:
+            if sug["speaker_id"] == speaker_id:
+                suggestion = sug
+                break
+
+        if not suggestion:
+            raise HTTPException(status_code=404, detail="Suggestion not found for this speaker")
+
+        if suggestion["applied"]:
+            raise HTTPException(status_code=400, detail="Suggestion already applied")
 
-    # Load suggestions
-    with open(suggestions_path, "r", encoding="utf-8") as f:
-        suggestions_data = json.load(f)
-
-    # Find the suggestion
-    suggestion = None
-    for sug in suggestions_data["suggestions"]:
-        if sug["speaker_id"] == speaker_id:
-            suggestion = sug
-            break
-
-    if not suggestion:
-        raise HTTPException(status_code=404, detail="Suggestion not found for this speaker")
-
-    if suggestion["applied"]:
-        raise HTTPException(status_code=400, detail="Suggestion already applied")
-
-    # Apply the name to both transcript files
-    display_name = suggestion["display_name"]
-    transcript_data = None
-
-    # Update transcript.json
-    transcript_path = output_dir / "transcript.json"
-    if transcript_path.exists():
-        with open(transcript_path, "r", encoding="utf-8") as f:
-            transcript_data = json.load(f)
-        if speaker_id in transcript_data.get("speakers", {}):
-            transcript_data["speakers"][speaker_id]["name"] = display_name
-            with open(transcript_path, "w", encoding="utf-8") as f:
-                json.dump(transcript_data, f, ensure_ascii=False, indent=2)
-
-    # Update transcript_cleaned.json
-    cleaned_path = output_dir / "transcript_cleaned.json"
-    cleaned_data = None
-    if cleaned_path.exists():
-        with open(cleaned_path, "r", encoding="utf-8") as f:
-            cleaned_data = json.load(f)
-        if speaker_id in cleaned_data.get("speakers", {}):
-            cleaned_data["speakers"][speaker_id]["name"] = display_name
-            with open(cleaned_path, "w", encoding="utf-8") as f:
-                json.dump(cleaned_data, f, ensure_ascii=False, indent=2)
-
-    # Regenerate TXT files
-    from api.transcribe import _regenerate_txt_files
-    _regenerate_txt_files(output_dir, transcript_data, cleaned_data)
-
-    # Mark suggestion as applied
-    suggestion["applied"] = True
-    with open(suggestions_path, "w", encoding="utf-8") as f:
-        json.dump(suggestions_data, f, ensure_ascii=False, indent=2)
-
-    # Update database
-    if transcription.speaker_names is None:
-        transcription.speaker_names = {}
-    transcription.speaker_names[speaker_id] = display_name
-    db.commit()
-
-    return {"status": "applied", "speaker_id": speaker_id, "name": display_name}
+        # Apply the name to both transcript files
+        display_name = suggestion["display_name"]
+        transcript_data = None
+
+        # Update transcript.json
+        transcript_path = output_dir / "transcript.json"
+        if transcript_path.exists():
+            transcript_data = await _read_json(transcript_path)
+            if speaker_id in transcript_data.get("speakers", {}):
+                transcript_data["speakers"][speaker_id]["name"] = display_name
+                await asyncio.to_thread(write_json_atomic, transcript_path, transcript_data)
+
+        # Update transcript_cleaned.json
+        cleaned_path = output_dir / "transcript_cleaned.json"
+        cleaned_data = None
+        if cleaned_path.exists():
+            cleaned_data = await _read_json(cleaned_path)
+            if speaker_id in cleaned_data.get("speakers", {}):
+                cleaned_data["speakers"][speaker_id]["name"] = display_name
+                await asyncio.to_thread(write_json_atomic, cleaned_path, cleaned_data)
+
+        # TXT files are derived from the JSON just written, so rebuild them after responding
+        background_tasks.add_task(_regenerate_txt_files, output_dir, transcript_data, cleaned_data)
+
+        # Mark suggestion as applied
+        suggestion["applied"] = True
+        await asyncio.to_thread(write_json_atomic, suggestions_path, suggestions_data)
+
+        # Update database; in-place changes to a JSON column are not tracked, so flag it
+        transcription.speaker_names = {
+            **(transcription.speaker_names or {}), speaker_id: display_name
+        }
+        flag_modified(transcription, "speaker_names")
+        await db.commit()
+
+        return {"status": "applied", "speaker_id": speaker_id, "name": display_name}
 
 
 @router.post("/transcriptions/{transcription_id}/suggestions/apply-all")
 async def apply_all_speaker_suggestions(
     transcription_id: str,
-    db: Session = Depends(get_db),
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Apply all non-applied speaker name suggestions."""
-    import json
-    from pathlib import Path
-
-    transcription = db.query(Transcription).filter(
-        Transcription.id == transcription_id
-    ).first()
+    transcription = await _get_transcription(
+        db, transcription_id, Transcription.output_dir, Transcription.speaker_names
+    )
 
     if not transcription:
         raise HTTPException(status_code=404, detail="Transcription not found")
@@ -679,73 +841,66 @@ async def apply_all_speaker_suggestions(
     if not transcription.output_dir:
         raise HTTPException(status_code=404, detail="Transcript not ready")
 
-    output_dir = Path(transcription.output_dir)
-    suggestions_path = output_dir / "speaker_suggestions.json"
-
-    if not suggestions_path.exists():
-        raise HTTPException(status_code=404, detail="No speaker suggestions available")
-
-    # Load suggestions
-    with open(suggestions_path, "r", encoding="utf-8") as f:
-        suggestions_data = json.load(f)
-
-    # Load transcript files
-    transcript_path = output_dir / "transcript.json"
-    cleaned_path = output_dir / "transcript_cleaned.json"
-
-    transcript_data = None
-    cleaned_data = None
-
-    if transcript_path.exists():
-        with open(transcript_path, "r", encoding="utf-8") as f:
-            transcript_data = json.load(f)
+    # Concurrent applies would read and rewrite the same files
+    with _exclusive_job("apply-suggestions", transcription_id, "Apply already in progress"):
+        output_dir = Path(transcription.output_dir)
+        suggestions_path = output_dir / "speaker_suggestions.json"
+        transcript_path = output_dir / "transcript.json"
+        cleaned_path = output_dir / "transcript_cleaned.json"
+
+        # Load suggestions and both transcript files concurrently
+        suggestions_data, transcript_data, cleaned_data = await asyncio.gather(
+            _read_json_if_exists(suggestions_path),
+            _read_json_if_exists(transcript_path),
+            _read_json_if_exists(cleaned_path),
+        )
 
-    if cleaned_path.exists():
-        with open(cleaned_path, "r", encoding="utf-8") as f:
-            cleaned_data = json.load(f)
+        if suggestions_data is None:
+            raise HTTPException(status_code=404, detail="No speaker suggestions available")
 
-    # Apply all non-applied suggestions
-    applied_count = 0
-    speaker_names = transcription.speaker_names or {}
+        # Apply all non-applied suggestions
+        applied_count = 0
+        speaker_names = dict(transcription.speaker_names or {})
 
-    for sug in suggestions_data["suggestions"]:
-        if sug["applied"] or not sug["display_name"]:
-            continue
+        for sug in suggestions_data["suggestions"]:
+            if sug["applied"] or not sug["display_name"]:
+                continue
 
-        speaker_id = sug["speaker_id"]
-        display_name = sug["display_name"]
+            speaker_id = sug["speaker_id"]
+            display_name = sug["display_name"]
 
-        # Update transcript.json
-        if transcript_data and speaker_id in transcript_data.get("speakers", {}):
-            transcript_data["speakers"][speaker_id]["name"] = display_name
-
-        # Update transcript_cleaned.json
-        if cleaned_data and speaker_id in cleaned_data.get("speakers", {}):
-            cleaned_data["speakers"][speaker_id]["name"] = display_name
+            # Update transcript.json
+            if transcript_data and speaker_id in transcript_data.get("speakers", {}):
+                transcript_data["speakers"][speaker_id]["name"] = display_name
 
-        # Mark as applied
-        sug["applied"] = True
-        speaker_names[speaker_id] = display_name
-        applied_count += 1
+            # Update transcript_cleaned.json
+            if cleaned_data and speaker_id in cleaned_data.get("speakers", {}):
+                cleaned_data["speakers"][speaker_id]["name"] = display_name
 
-    # Save all files
-    if transcript_data:
-        with open(transcript_path, "w", encoding="utf-8") as f:
-            json.dump(transcript_data, f, ensure_ascii=False, indent=2)
+            # Mark as applied
+            sug["applied"] = True
+            speaker_names[speaker_id] = display_name
+            applied_count += 1
 
-    if cleaned_data:
-        with open(cleaned_path, "w", encoding="utf-8") as f:
-            json.dump(cleaned_data, f, ensure_ascii=False, indent=2)
+        # Nothing changed, so there is nothing to rewrite
+        if applied_count == 0:
+            return {"status": "applied", "applied": 0}
 
-    with open(suggestions_path, "w", encoding="utf-8") as f:
-        json.dump(suggestions_data, f, ensure_ascii=False, indent=2)
+        # Update database with the complete map in a single UPDATE, before touching
+        # the files so a failed write leaves the names re-applicable from suggestions
+        transcription.speaker_names = speaker_names
+        flag_modified(transcription, "speaker_names")
+        await db.commit()
 
-    # Regenerate TXT files
-    from api.transcribe import _regenerate_txt_files
-    _regenerate_txt_files(output_dir, transcript_data, cleaned_data)
+        # Save all files
+        writes = [asyncio.to_thread(write_json_atomic, suggestions_path, suggestions_data)]
+        if transcript_data:
+            writes.append(asyncio.to_thread(write_json_atomic, transcript_path, transcript_data))
+        if cleaned_data:
+            writes.append(asyncio.to_thread(write_json_atomic, cleaned_path, cleaned_data))
+        await asyncio.gather(*writes)
 
-    # Update database
-    transcription.speaker_names = speaker_names
-    db.commit()
+        # TXT files are derived from the JSON just written, so rebuild them after responding
+        background_tasks.add_task(_regenerate_txt_files, output_dir, transcript_data, cleaned_data)
 
-    return {"status": "applied", "applied": applied_count}
+        return {"status": "applied", "applied": applied_count}
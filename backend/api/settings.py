@@ -1,12 +1,16 @@
 # api/settings.py
 """Settings API endpoints."""
-import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-from fastapi import APIRouter, Depends
-from pydantic import BaseModel
+from typing import Dict, Optional, Tuple
 
-from config import Settings, get_settings, clear_settings_cache, CONFIG_PATH
+from fastapi import APIRouter, Depends, Request, Response
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+from api.http_cache import cached_json_response, make_etag
+from config import Settings, get_settings, clear_settings_cache, load_config_file, CONFIG_PATH
+from engines.http_client import get_shared_client
+from services.json_files import write_json_atomic
 from workers.queue_processor import queue_processor
 
 router = APIRouter(prefix="/api/settings", tags=["settings"])
@@ -14,6 +18,8 @@ router = APIRouter(prefix="/api/settings", tags=["settings"])
 
 class SettingsResponse(BaseModel):
     """Current settings response."""
+    model_config = ConfigDict(from_attributes=True)
+
     # Transcription
     default_engine: str
     default_model: str
@@ -114,98 +120,89 @@ FEATURES = {
 }
 
 
+# Presence flags exposed instead of the secrets themselves
+_KEY_FLAGS = {
+    "has_hf_token": "hf_token",
+    "has_assemblyai_key": "assemblyai_api_key",
+    "has_elevenlabs_key": "elevenlabs_api_key",
+    "has_deepgram_key": "deepgram_api_key",
+    "has_yandex_key": "yandex_api_key",
+    "has_gemini_key": "gemini_api_key",
+    "has_openrouter_key": "openrouter_api_key",
+}
+
+
+class _SettingsView:
+    """Attribute view of Settings with key presence flags in place of the keys."""
+
+    def __init__(self, settings: Settings):
+        self._settings = settings
+
+    def __getattr__(self, name: str):
+        if name in _KEY_FLAGS:
+            return bool(getattr(self._settings, _KEY_FLAGS[name]))
+        if name == "features":
+            return FEATURES
+        return getattr(self._settings, name)
+
+
+def _build_settings_response(settings: Settings) -> SettingsResponse:
+    """Build the public settings view (key presence only, never the keys)."""
+    return SettingsResponse.model_validate(_SettingsView(settings))
+
+
+# Serializer compiled once and reused by both endpoints
+_SETTINGS_ADAPTER = TypeAdapter(SettingsResponse)
+
+# Settings only change through get_settings() returning a new instance
+# (restart or clear_settings_cache), so the serialized body and its ETag
+# are built once per instance and reused.
+_settings_body: Optional[Tuple[Settings, bytes, str]] = None
+
+
+def _settings_response_body(settings: Settings) -> Tuple[bytes, str]:
+    """Return the serialized SettingsResponse and its ETag for this settings instance."""
+    global _settings_body
+    if _settings_body is None or _settings_body[0] is not settings:
+        body = _SETTINGS_ADAPTER.dump_json(_build_settings_response(settings))
+        _settings_body = (settings, body, make_etag(body))
+    return _settings_body[1], _settings_body[2]
+
+
 @router.get("", response_model=SettingsResponse)
-async def get_current_settings(settings: Settings = Depends(get_settings)):
+async def get_current_settings(request: Request, settings: Settings = Depends(get_settings)):
     """Get current application settings."""
-    return SettingsResponse(
-        default_engine=settings.default_engine,
-        default_model=settings.default_model,
-        diarization_method=settings.diarization_method,
-        compute_device=settings.compute_device,
-        min_speakers=settings.min_speakers,
-        max_speakers=settings.max_speakers,
-        whisper_no_speech_threshold=settings.whisper_no_speech_threshold,
-        whisper_logprob_threshold=settings.whisper_logprob_threshold,
-        whisper_compression_ratio_threshold=settings.whisper_compression_ratio_threshold,
-        whisper_hallucination_silence_threshold=settings.whisper_hallucination_silence_threshold,
-        whisper_condition_on_previous_text=settings.whisper_condition_on_previous_text,
-        whisper_initial_prompt=settings.whisper_initial_prompt,
-        default_llm_provider=settings.default_llm_provider,
-        postprocessing_provider=settings.postprocessing_provider,
-        postprocessing_model=settings.postprocessing_model,
-        postprocessing_default_template=settings.postprocessing_default_template,
-        insights_provider=settings.insights_provider,
-        insights_model=settings.insights_model,
-        insights_default_template=settings.insights_default_template,
-        has_hf_token=bool(settings.hf_token),
-        has_assemblyai_key=bool(settings.assemblyai_api_key),
-        has_elevenlabs_key=bool(settings.elevenlabs_api_key),
-        has_deepgram_key=bool(settings.deepgram_api_key),
-        has_yandex_key=bool(settings.yandex_api_key),
-        has_gemini_key=bool(settings.gemini_api_key),
-        has_openrouter_key=bool(settings.openrouter_api_key),
-        features=FEATURES,
-    )
+    body, etag = _settings_response_body(settings)
+    # max-age=0: clients always revalidate, so a saved change shows up immediately
+    return cached_json_response(request, body, etag, max_age=0)
 
 
 @router.put("", response_model=SettingsResponse)
 async def update_settings(update: SettingsUpdateRequest):
     """Update application settings. Saves to config.json."""
     # Load existing config
-    config = {}
-    if CONFIG_PATH.exists():
-        try:
-            with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-                config = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            pass
+    config = load_config_file()
 
     # Update only provided fields
-    update_data = update.model_dump(exclude_none=True)
-    for key, value in update_data.items():
-        if value is not None and value != "":
-            config[key] = value
+    update_data = update.model_dump(exclude_unset=True, exclude_none=True)
+    changes = {key: value for key, value in update_data.items() if value != ""}
+    config.update(changes)
 
     # Save config
     CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-        json.dump(config, f, indent=2, ensure_ascii=False)
+    write_json_atomic(CONFIG_PATH, config)
+
+    # config.json takes priority over env, so overlaying the changes on the
+    # cached settings gives the reloaded values without re-parsing everything
+    settings = get_settings().model_copy(update=changes)
 
-    # Clear settings cache and reset workers to apply new settings
+    # Clear settings cache and reset workers to apply new settings;
+    # the next get_settings() call reloads lazily
     clear_settings_cache()
     queue_processor.reset_workers()
 
-    # Return updated settings
-    settings = get_settings()
-    return SettingsResponse(
-        default_engine=settings.default_engine,
-        default_model=settings.default_model,
-        diarization_method=settings.diarization_method,
-        compute_device=settings.compute_device,
-        min_speakers=settings.min_speakers,
-        max_speakers=settings.max_speakers,
-        whisper_no_speech_threshold=settings.whisper_no_speech_threshold,
-        whisper_logprob_threshold=settings.whisper_logprob_threshold,
-        whisper_compression_ratio_threshold=settings.whisper_compression_ratio_threshold,
-        whisper_hallucination_silence_threshold=settings.whisper_hallucination_silence_threshold,
-        whisper_condition_on_previous_text=settings.whisper_condition_on_previous_text,
-        whisper_initial_prompt=settings.whisper_initial_prompt,
-        default_llm_provider=settings.default_llm_provider,
-        postprocessing_provider=settings.postprocessing_provider,
-        postprocessing_model=settings.postprocessing_model,
-        postprocessing_default_template=settings.postprocessing_default_template,
-        insights_provider=settings.insights_provider,
-        insights_model=settings.insights_model,
-        insights_default_template=settings.insights_default_template,
-        has_hf_token=bool(settings.hf_token),
-        has_assemblyai_key=bool(settings.assemblyai_api_key),
-        has_elevenlabs_key=bool(settings.elevenlabs_api_key),
-        has_deepgram_key=bool(settings.deepgram_api_key),
-        has_yandex_key=bool(settings.yandex_api_key),
-        has_gemini_key=bool(settings.gemini_api_key),
-        has_openrouter_key=bool(settings.openrouter_api_key),
-        features=FEATURES,
-    )
+    body = _SETTINGS_ADAPTER.dump_json(_build_settings_response(settings))
+    return Response(content=body, media_type="application/json")
 
 
 class ValidateKeyRequest(BaseModel):
@@ -220,22 +217,27 @@ class ValidateKeyResponse(BaseModel):
     error: Optional[str] = None
 
 
-@router.post("/validate-key", response_model=ValidateKeyResponse)
-async def validate_api_key(request: ValidateKeyRequest):
-    """Validate an API key for a cloud provider."""
+@lru_cache(maxsize=1)
+def _key_validation_engines() -> Dict[str, type]:
+    """Cloud engines that support key validation, imported on first use."""
     from engines import AssemblyAIEngine, DeepgramEngine, ElevenLabsEngine, YandexEngine
 
-    engines = {
+    return {
         "assemblyai": AssemblyAIEngine,
         "deepgram": DeepgramEngine,
         "elevenlabs": ElevenLabsEngine,
         "yandex": YandexEngine,
     }
 
-    if request.provider not in engines:
+
+@router.post("/validate-key", response_model=ValidateKeyResponse)
+async def validate_api_key(request: ValidateKeyRequest):
+    """Validate an API key for a cloud provider."""
+    engine_cls = _key_validation_engines().get(request.provider)
+    if engine_cls is None:
         return ValidateKeyResponse(valid=False, error=f"Unknown provider: {request.provider}")
 
-    engine = engines[request.provider](api_key=request.api_key)
-    result = await engine.validate_api_key()
+    engine = engine_cls(api_key=request.api_key)
+    result = await engine.validate_api_key(client=get_shared_client())
 
     return ValidateKeyResponse(**result)
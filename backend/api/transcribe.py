@@ -1,21 +1,29 @@
 # api/transcribe.py
 """Transcription API endpoints."""
-import json
+import asyncio
 import mimetypes
-import shutil
+from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
+
+import aiofiles
+import orjson
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, Response, UploadFile
-from sqlalchemy.orm import Session
-from pydantic import BaseModel
+from sqlalchemy import delete, select, tuple_, update as sa_update
+from sqlalchemy.orm import Session, load_only
+from pydantic import BaseModel, ConfigDict
 
+from api.http_cache import cached_file_response
+from api.pagination import decode_keyset_cursor, encode_keyset_cursor
 from models import get_db, Transcription, TranscriptionStatus, LLMOperation, LLMOperationType
 from config import get_settings, Settings
+from services.json_files import write_json_atomic
 
 router = APIRouter(prefix="/api/transcribe", tags=["transcription"])
 
-ALLOWED_EXTENSIONS = {".mp3", ".m4a", ".wav", ".ogg", ".flac", ".webm"}
+ALLOWED_EXTENSIONS = frozenset({".mp3", ".m4a", ".wav", ".ogg", ".flac", ".webm"})
 AUDIO_CONTENT_TYPES = {
     ".mp3": "audio/mpeg",
     ".m4a": "audio/mp4",
@@ -25,21 +33,42 @@ AUDIO_CONTENT_TYPES = {
     ".webm": "audio/webm",
 }
 AUDIO_STREAM_CHUNK_SIZE = 1024 * 1024
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 PLAYBACK_PREVIEW_FILENAME = "playback_preview.m4a"
 
 
-def _format_timestamp(seconds: float) -> str:
-    """Format timestamp as HH:MM:SS."""
-    hours, remainder = divmod(int(seconds), 3600)
+@lru_cache(maxsize=8192)
+def _format_whole_seconds(seconds: int) -> str:
+    """Format whole seconds as HH:MM:SS."""
+    hours, remainder = divmod(seconds, 3600)
     minutes, secs = divmod(remainder, 60)
     return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
 
+def _format_timestamp(seconds: float) -> str:
+    """Format timestamp as HH:MM:SS."""
+    # Segment starts repeat at one-second resolution, so cache on the whole second
+    return _format_whole_seconds(int(seconds))
+
+
+def _render_txt(header: List[str], speakers_dict: dict, segments: List[dict]) -> str:
+    """Render transcript TXT: header lines, one block per segment, closing rule."""
+    # Resolve display names once instead of per segment
+    names = {speaker_id: info.get("name", speaker_id) for speaker_id, info in speakers_dict.items()}
+    format_timestamp = _format_timestamp
+    body = "".join(
+        f"[{format_timestamp(seg.get('start', 0))}] "
+        f"{names.get((speaker_id := seg.get('speaker', 'SPEAKER_UNKNOWN')), speaker_id)}: "
+        f"{seg.get('text', '')}\n\n"
+        for seg in segments
+    )
+    return "\n".join(header) + "\n" + body + "-" * 40
+
+
 def _regenerate_txt_files(output_dir: Path, original_data: Optional[dict], cleaned_data: Optional[dict]):
     """Regenerate TXT files with current speaker names from JSON data."""
     # Regenerate transcript.txt
     if original_data:
-        txt_path = output_dir / "transcript.txt"
         meta = original_data.get("metadata", {})
         speakers_dict = original_data.get("speakers", {})
         segments = original_data.get("segments", [])
@@ -53,7 +82,7 @@ def _regenerate_txt_files(output_dir: Path, original_data: Optional[dict], clean
         minutes, secs = divmod(remainder, 60)
         duration_str = f"{hours}:{minutes:02d}:{secs:02d}" if hours else f"{minutes}:{secs:02d}"
 
-        lines = [
+        header = [
             f"Transcription: {meta.get('filename', 'Unknown')}",
             f"Date: {meta.get('created_at', '')[:10]}",
             f"Duration: {duration_str}",
@@ -62,27 +91,14 @@ def _regenerate_txt_files(output_dir: Path, original_data: Optional[dict], clean
             "-" * 40,
             "",
         ]
-
-        for seg in segments:
-            timestamp = _format_timestamp(seg.get("start", 0))
-            speaker_id = seg.get("speaker", "SPEAKER_UNKNOWN")
-            speaker = speakers_dict.get(speaker_id, {}).get("name", speaker_id)
-            lines.append(f"[{timestamp}] {speaker}: {seg.get('text', '')}")
-            lines.append("")
-
-        lines.append("-" * 40)
-
-        with open(txt_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
+        (output_dir / "transcript.txt").write_text(
+            _render_txt(header, speakers_dict, segments), encoding="utf-8"
+        )
 
     # Regenerate transcript_cleaned.txt
     if cleaned_data:
-        txt_path = output_dir / "transcript_cleaned.txt"
         meta = cleaned_data.get("metadata", {})
-        speakers_dict = cleaned_data.get("speakers", {})
-        segments = cleaned_data.get("segments", [])
-
-        lines = [
+        header = [
             f"Cleaned Transcript: {meta.get('filename', 'Unknown')}",
             f"Cleaned: {meta.get('cleaned_at', '')[:10]}",
             f"Template: {meta.get('template', '')}",
@@ -91,18 +107,10 @@ def _regenerate_txt_files(output_dir: Path, original_data: Optional[dict], clean
             "-" * 40,
             "",
         ]
-
-        for seg in segments:
-            timestamp = _format_timestamp(seg.get("start", 0))
-            speaker_id = seg.get("speaker", "SPEAKER_UNKNOWN")
-            speaker = speakers_dict.get(speaker_id, {}).get("name", speaker_id)
-            lines.append(f"[{timestamp}] {speaker}: {seg.get('text', '')}")
-            lines.append("")
-
-        lines.append("-" * 40)
-
-        with open(txt_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
+        (output_dir / "transcript_cleaned.txt").write_text(
+            _render_txt(header, cleaned_data.get("speakers", {}), cleaned_data.get("segments", [])),
+            encoding="utf-8",
+        )
 
 
 def _resolve_audio_path(transcription: Transcription) -> Path:
@@ -184,6 +192,8 @@ def _iter_file_range(audio_path: Path, start: int, end: int):
 
 class LLMOperationSummary(BaseModel):
     """Summary of an LLM operation (clean or insights)."""
+    model_config = ConfigDict(from_attributes=True)
+
     operation_type: str  # "cleanup" | "insights"
     provider: str
     model: str
@@ -197,6 +207,8 @@ class LLMOperationSummary(BaseModel):
 
 class TranscriptionResponse(BaseModel):
     """Response model for transcription."""
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     filename: str
     status: str
@@ -220,8 +232,30 @@ class TranscriptionResponse(BaseModel):
     # LLM operations
     llm_operations: List[LLMOperationSummary] = []
 
-    class Config:
-        from_attributes = True
+
+# Fields copied as-is from the ORM rows; the rest are derived in _to_response
+_RESPONSE_FIELDS = tuple(
+    name for name in TranscriptionResponse.model_fields
+    if name not in ("status", "workflow_status", "llm_operations")
+)
+_OPERATION_FIELDS = tuple(
+    name for name in LLMOperationSummary.model_fields if name != "operation_type"
+)
+
+def _to_response(t: Transcription, llm_ops: List[LLMOperation]) -> TranscriptionResponse:
+    """Build TranscriptionResponse from trusted DB rows without re-validating them."""
+    return TranscriptionResponse.model_construct(
+        **{name: getattr(t, name) for name in _RESPONSE_FIELDS},
+        status=t.status.value,
+        workflow_status=t.workflow_status or "pending",
+        llm_operations=[
+            LLMOperationSummary.model_construct(
+                **{name: getattr(op, name) for name in _OPERATION_FIELDS},
+                operation_type=op.operation_type.value,
+            )
+            for op in llm_ops
+        ],
+    )
 
 
 @router.post("/upload", response_model=TranscriptionResponse, status_code=201)
@@ -236,12 +270,18 @@ async def upload_audio(
     settings: Settings = Depends(get_settings),
 ):
     """Upload an audio file for transcription."""
+    # The name becomes a path under uploads_path, so it must not contain separators
+    filename = file.filename or ""
+    if "/" in filename or "\\" in filename:
+        raise HTTPException(status_code=400, detail="Invalid filename")
+
     # Validate file extension
-    file_ext = Path(file.filename).suffix.lower()
+    dot = filename.rfind(".")
+    file_ext = filename[dot:].lower() if dot > 0 else ""
     if file_ext not in ALLOWED_EXTENSIONS:
         raise HTTPException(
             status_code=400,
-            detail=f"File type {file_ext} not supported. Allowed: {ALLOWED_EXTENSIONS}"
+            detail=f"File type {file_ext} not supported. Allowed: {', '.join(sorted(ALLOWED_EXTENSIONS))}"
         )
 
     # Ensure directories exist
@@ -249,11 +289,11 @@ async def upload_audio(
 
     # Save uploaded file
     upload_path = settings.uploads_path / file.filename
-    with open(upload_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
-
-    # Get file size
-    file_size = upload_path.stat().st_size
+    file_size = 0
+    async with aiofiles.open(upload_path, "wb") as buffer:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            await buffer.write(chunk)
+            file_size += len(chunk)
 
     # Create transcription record
     transcription = Transcription(
@@ -271,25 +311,21 @@ async def upload_audio(
     db.commit()
     db.refresh(transcription)
 
-    return TranscriptionResponse(
-        id=transcription.id,
-        filename=transcription.filename,
-        status=transcription.status.value,
-        engine=transcription.engine,
-        model=transcription.model,
-        language=transcription.language,
-        initial_prompt=transcription.initial_prompt,
-        created_at=transcription.created_at,
-        progress=transcription.progress,
-        error_message=transcription.error_message,
-        file_size=transcription.file_size,
-        duration_seconds=transcription.duration_seconds,
-        workflow_status=transcription.workflow_status or "pending",
-        workflow_comment=transcription.workflow_comment,
-        processing_time_seconds=transcription.processing_time_seconds,
-        transcription_time_seconds=transcription.transcription_time_seconds,
-        diarization_time_seconds=transcription.diarization_time_seconds,
-    )
+    # A fresh upload has no LLM operations yet
+    return _to_response(transcription, [])
+
+
+# Columns selected for the queue listing, one per TranscriptionResponse field
+_RESPONSE_COLUMNS = tuple(
+    getattr(Transcription, name) for name in (*_RESPONSE_FIELDS, "status", "workflow_status")
+)
+
+# Columns selected for each LLMOperationSummary, plus the key used to group them
+_OPERATION_SUMMARY_COLUMNS = (
+    LLMOperation.transcription_id,
+    LLMOperation.operation_type,
+    *(getattr(LLMOperation, name) for name in _OPERATION_FIELDS),
+)
 
 
 def _build_transcription_response(t: Transcription, db: Session) -> TranscriptionResponse:
@@ -297,65 +333,71 @@ def _build_transcription_response(t: Transcription, db: Session) -> Transcriptio
     # Fetch LLM operations for this transcription
     llm_ops = (
         db.query(LLMOperation)
+        .options(load_only(*_OPERATION_SUMMARY_COLUMNS))
         .filter(LLMOperation.transcription_id == t.id)
         .order_by(LLMOperation.created_at.desc())
         .all()
     )
 
-    llm_operations = [
-        LLMOperationSummary(
-            operation_type=op.operation_type.value,
-            provider=op.provider,
-            model=op.model,
-            template_id=op.template_id,
-            input_tokens=op.input_tokens,
-            output_tokens=op.output_tokens,
-            cost_usd=op.cost_usd,
-            processing_time_seconds=op.processing_time_seconds,
-            created_at=op.created_at,
-        )
-        for op in llm_ops
-    ]
-
-    return TranscriptionResponse(
-        id=t.id,
-        filename=t.filename,
-        status=t.status.value,
-        engine=t.engine,
-        model=t.model,
-        language=t.language,
-        initial_prompt=t.initial_prompt,
-        created_at=t.created_at,
-        progress=t.progress,
-        error_message=t.error_message,
-        file_size=t.file_size,
-        duration_seconds=t.duration_seconds,
-        compute_device=t.compute_device,
-        diarization_method=t.diarization_method,
-        processing_time_seconds=t.processing_time_seconds,
-        transcription_time_seconds=t.transcription_time_seconds,
-        diarization_time_seconds=t.diarization_time_seconds,
-        workflow_status=t.workflow_status or "pending",
-        workflow_comment=t.workflow_comment,
-        llm_operations=llm_operations,
-    )
+    return _to_response(t, llm_ops)
 
 
 @router.get("/queue", response_model=List[TranscriptionResponse])
 async def list_queue(
     db: Session = Depends(get_db),
     limit: Optional[int] = None,
+    cursor: Optional[str] = None,
 ):
     """List transcriptions in reverse chronological order.
 
     By default returns the full list for the UI. Optional limit is kept for
-    ad-hoc callers that want a smaller result set.
+    ad-hoc callers that want a smaller result set; pass the X-Next-Cursor
+    header of a full page as ``cursor`` to get the transcriptions after it.
     """
-    query = db.query(Transcription).order_by(Transcription.created_at.desc())
+    stmt = select(*_RESPONSE_COLUMNS).order_by(
+        Transcription.created_at.desc(), Transcription.id.desc()
+    )
+    if cursor:
+        stmt = stmt.where(
+            tuple_(Transcription.created_at, Transcription.id) < decode_keyset_cursor(cursor)
+        )
     if limit is not None:
-        query = query.limit(limit)
-    transcriptions = query.all()
-    return [_build_transcription_response(t, db) for t in transcriptions]
+        stmt = stmt.limit(limit)
+    rows = db.execute(stmt).all()
+
+    # One query for every listed transcription's operations instead of one per row
+    ops_by_transcription: Dict[str, List[dict]] = defaultdict(list)
+    listed_ids = stmt.with_only_columns(Transcription.id).subquery()
+    op_rows = db.execute(
+        select(*_OPERATION_SUMMARY_COLUMNS)
+        .where(LLMOperation.transcription_id.in_(select(listed_ids.c.id)))
+        .order_by(LLMOperation.created_at.desc())
+    )
+    for op in op_rows:
+        summary = op._asdict()
+        summary["operation_type"] = summary["operation_type"].value
+        ops_by_transcription[summary.pop("transcription_id")].append(summary)
+
+    # Plain column rows straight to orjson: no ORM instances or pydantic models
+    # per row. response_model stays for the OpenAPI schema
+    payload = []
+    for row in rows:
+        item = row._asdict()
+        item["status"] = item["status"].value
+        item["workflow_status"] = item["workflow_status"] or "pending"
+        item["llm_operations"] = ops_by_transcription[item["id"]]
+        payload.append(item)
+
+    headers = {}
+    if rows and len(rows) == limit:
+        last = rows[-1]
+        headers["X-Next-Cursor"] = encode_keyset_cursor(last.created_at, last.id)
+
+    return Response(
+        content=orjson.dumps(payload),
+        media_type="application/json",
+        headers=headers,
+    )
 
 
 class StartRequest(BaseModel):
@@ -375,27 +417,21 @@ async def start_transcriptions(
     db: Session = Depends(get_db),
 ):
     """Move selected transcriptions from DRAFT to QUEUED status."""
-    started = 0
-    failed = 0
-
-    for tid in request.ids:
-        transcription = db.query(Transcription).filter(
-            Transcription.id == tid
-        ).first()
-
-        if not transcription:
-            failed += 1
-            continue
-
-        if transcription.status != TranscriptionStatus.DRAFT:
-            failed += 1
-            continue
-
-        transcription.status = TranscriptionStatus.QUEUED
-        started += 1
+    # One UPDATE for the whole batch; ids that are unknown or not drafts count as failed
+    started_ids = db.execute(
+        sa_update(Transcription)
+        .where(
+            Transcription.id.in_(request.ids),
+            Transcription.status == TranscriptionStatus.DRAFT,
+        )
+        .values(status=TranscriptionStatus.QUEUED)
+        .returning(Transcription.id),
+        execution_options={"synchronize_session": False},
+    ).scalars().all()
 
     db.commit()
-    return StartResponse(started=started, failed=failed)
+    started = len(started_ids)
+    return StartResponse(started=started, failed=len(request.ids) - started)
 
 
 @router.post("/start-all", response_model=StartResponse)
@@ -498,6 +534,7 @@ async def delete_transcription(
 @router.get("/{transcription_id}/transcript")
 async def get_transcript_data(
     transcription_id: str,
+    request: Request,
     db: Session = Depends(get_db),
 ):
     """Get the full transcript JSON data."""
@@ -515,8 +552,46 @@ async def get_transcript_data(
     if not transcript_path.exists():
         raise HTTPException(status_code=404, detail="Transcript file not found")
 
-    with open(transcript_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    # Already JSON on disk, so send the bytes as stored instead of parsing and re-encoding
+    return cached_file_response(request, transcript_path, "application/json")
+
+
+def _apply_speaker_names(data: dict, speaker_names: dict) -> bool:
+    """Set speaker display names in transcript data; return True if any changed."""
+    speakers = data.get("speakers", {})
+    changed = False
+    for speaker_id, name in speaker_names.items():
+        speaker = speakers.get(speaker_id)
+        if speaker is not None and speaker.get("name") != name:
+            speaker["name"] = name
+            changed = True
+    return changed
+
+
+def _update_speaker_files(output_dir: Path, speaker_names: dict):
+    """Apply speaker names to the transcript JSON files and regenerate their TXT."""
+    original_data = None
+    cleaned_data = None
+
+    # Rewrite each file only if a name actually changes; unchanged files
+    # stay as they are and are left out of the TXT regeneration
+    transcript_path = output_dir / "transcript.json"
+    if transcript_path.exists():
+        original_data = orjson.loads(transcript_path.read_bytes())
+        if _apply_speaker_names(original_data, speaker_names):
+            write_json_atomic(transcript_path, original_data)
+        else:
+            original_data = None
+
+    cleaned_path = output_dir / "transcript_cleaned.json"
+    if cleaned_path.exists():
+        cleaned_data = orjson.loads(cleaned_path.read_bytes())
+        if _apply_speaker_names(cleaned_data, speaker_names):
+            write_json_atomic(cleaned_path, cleaned_data)
+        else:
+            cleaned_data = None
+
+    _regenerate_txt_files(output_dir, original_data, cleaned_data)
 
 
 class SpeakerNamesUpdate(BaseModel):
@@ -535,20 +610,17 @@ async def delete_history(
         filter_type: 'all' to delete everything, 'failed' to delete only failed
     """
     if filter_type == "failed":
-        count = db.query(Transcription).filter(
-            Transcription.status == TranscriptionStatus.FAILED
-        ).count()
-        db.query(Transcription).filter(
-            Transcription.status == TranscriptionStatus.FAILED
-        ).delete()
+        stmt = delete(Transcription).where(Transcription.status == TranscriptionStatus.FAILED)
     elif filter_type == "all":
-        count = db.query(Transcription).count()
-        db.query(Transcription).delete()
+        stmt = delete(Transcription)
     else:
         raise HTTPException(status_code=400, detail="filter_type must be 'all' or 'failed'")
 
+    # One DELETE; rowcount replaces the separate COUNT, and nothing loaded
+    # in this request-scoped session needs syncing
+    result = db.execute(stmt, execution_options={"synchronize_session": False})
     db.commit()
-    return {"deleted": count}
+    return {"deleted": result.rowcount}
 
 
 @router.put("/{transcription_id}/speakers")
@@ -558,51 +630,25 @@ async def update_speakers(
     db: Session = Depends(get_db),
 ):
     """Update speaker names for a transcription."""
-    transcription = db.query(Transcription).filter(
-        Transcription.id == transcription_id
+    # Update in database; RETURNING hands back output_dir without a prior SELECT
+    row = db.execute(
+        sa_update(Transcription)
+        .where(Transcription.id == transcription_id)
+        .values(speaker_names=update.speaker_names)
+        .returning(Transcription.output_dir),
+        execution_options={"synchronize_session": False},
     ).first()
-
-    if not transcription:
-        raise HTTPException(status_code=404, detail="Transcription not found")
-
-    # Update in database
-    transcription.speaker_names = update.speaker_names
     db.commit()
 
-    # Update in transcript files
-    if transcription.output_dir:
-        output_dir = Path(transcription.output_dir)
-        original_data = None
-        cleaned_data = None
-
-        # Update transcript.json
-        transcript_path = output_dir / "transcript.json"
-        if transcript_path.exists():
-            with open(transcript_path, "r", encoding="utf-8") as f:
-                original_data = json.load(f)
-
-            for speaker_id, name in update.speaker_names.items():
-                if speaker_id in original_data["speakers"]:
-                    original_data["speakers"][speaker_id]["name"] = name
-
-            with open(transcript_path, "w", encoding="utf-8") as f:
-                json.dump(original_data, f, ensure_ascii=False, indent=2)
-
-        # Update transcript_cleaned.json if exists
-        cleaned_path = output_dir / "transcript_cleaned.json"
-        if cleaned_path.exists():
-            with open(cleaned_path, "r", encoding="utf-8") as f:
-                cleaned_data = json.load(f)
-
-            for speaker_id, name in update.speaker_names.items():
-                if speaker_id in cleaned_data.get("speakers", {}):
-                    cleaned_data["speakers"][speaker_id]["name"] = name
-
-            with open(cleaned_path, "w", encoding="utf-8") as f:
-                json.dump(cleaned_data, f, ensure_ascii=False, indent=2)
+    if row is None:
+        raise HTTPException(status_code=404, detail="Transcription not found")
 
-        # Regenerate TXT files with updated speaker names
-        _regenerate_txt_files(output_dir, original_data, cleaned_data)
+    # Update in transcript files; parsing and rewriting them is blocking IO,
+    # so it runs in a worker thread to keep the event loop free
+    if row.output_dir:
+        await asyncio.to_thread(
+            _update_speaker_files, Path(row.output_dir), update.speaker_names
+        )
 
     return {"status": "ok"}
 
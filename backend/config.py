@@ -1,14 +1,45 @@
 # config.py
 """Application configuration using pydantic-settings with config.json priority."""
-import json
 from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple, Type
+
+import orjson
 from pydantic import Field
 from pydantic_settings import BaseSettings, PydanticBaseSettingsSource
 
 CONFIG_PATH = Path.home() / ".transcribeflow" / "config.json"
 
+# Post-processing and insight templates are re-read from disk at most this
+# often (seconds), so manual edits to their JSON files still show up without
+# a restart.
+TEMPLATE_CACHE_TTL = 600
+
+# Keep stored LLM error messages bounded
+MAX_ERROR_MESSAGE_LENGTH = 500
+
+# Last parsed config.json, keyed by (path, mtime_ns) so edits are picked up
+_config_cache: Optional[Tuple[Path, int, Dict[str, Any]]] = None
+
+
+def load_config_file() -> Dict[str, Any]:
+    """Load config.json, reusing the previous parse while the file is unchanged.
+
+    Returns a fresh copy that callers may modify.
+    """
+    global _config_cache
+    try:
+        mtime = CONFIG_PATH.stat().st_mtime_ns
+    except OSError:
+        return {}
+    if _config_cache is None or _config_cache[:2] != (CONFIG_PATH, mtime):
+        try:
+            data = orjson.loads(CONFIG_PATH.read_bytes())
+        except (orjson.JSONDecodeError, OSError):
+            return {}
+        _config_cache = (CONFIG_PATH, mtime, data)
+    return dict(_config_cache[2])
+
 
 class JsonConfigSettingsSource(PydanticBaseSettingsSource):
     """Custom settings source that reads from config.json file."""
@@ -27,15 +58,9 @@ class JsonConfigSettingsSource(PydanticBaseSettingsSource):
 
     def _load_config(self) -> Dict[str, Any]:
         """Load config from JSON file, filtering out deprecated fields."""
-        if CONFIG_PATH.exists():
-            try:
-                with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-                    config = json.load(f)
-                    # Filter out deprecated fields
-                    return {k: v for k, v in config.items() if k not in self.DEPRECATED_FIELDS}
-            except (json.JSONDecodeError, IOError):
-                return {}
-        return {}
+        config = load_config_file()
+        # Filter out deprecated fields
+        return {k: v for k, v in config.items() if k not in self.DEPRECATED_FIELDS}
 
     def __call__(self) -> Dict[str, Any]:
         """Return all config values."""
@@ -150,6 +175,8 @@ class Settings(BaseSettings):
 
 def clear_settings_cache():
     """Clear the settings cache to reload config."""
+    global _config_cache
+    _config_cache = None
     get_settings.cache_clear()
 
 
@@ -7,6 +7,7 @@ from engines.assemblyai import AssemblyAIEngine
 from engines.deepgram import DeepgramEngine
 from engines.elevenlabs import ElevenLabsEngine
 from engines.yandex import YandexEngine
+from engines.http_client import get_shared_client, close_shared_client
 
 __all__ = [
     "TranscriptionEngine",
@@ -19,4 +20,6 @@ __all__ = [
     "DeepgramEngine",
     "ElevenLabsEngine",
     "YandexEngine",
+    "get_shared_client",
+    "close_shared_client",
 ]
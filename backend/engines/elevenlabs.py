@@ -8,6 +8,7 @@ from typing import Any, Dict, Optional
 import httpx
 
 from engines.base import TranscriptionEngine, TranscriptionResult
+from engines.http_client import client_session
 
 
 class ElevenLabsEngine(TranscriptionEngine):
@@ -25,12 +26,15 @@ class ElevenLabsEngine(TranscriptionEngine):
     def is_available(self) -> bool:
         return bool(self.api_key)
 
-    async def validate_api_key(self) -> Dict[str, Any]:
-        """Validate API key by making a test request."""
+    async def validate_api_key(self, client: Optional[httpx.AsyncClient] = None) -> Dict[str, Any]:
+        """Validate API key by making a test request.
+
+        Pass a shared client to reuse its connections; otherwise one is created.
+        """
         if not self.api_key:
             return {"valid": False, "error": "No API key provided"}
 
-        async with httpx.AsyncClient() as client:
+        async with client_session(client) as client:
             response = await client.get(
                 f"{self.BASE_URL}/user",
                 headers={"xi-api-key": self.api_key},
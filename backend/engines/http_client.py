@@ -0,0 +1,41 @@
+# engines/http_client.py
+"""Shared HTTP client for short cloud API calls made from request handlers."""
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import httpx
+
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Get the process-wide client, created on first use.
+
+    Only use it from the server's event loop: transcription runs each job in
+    its own loop via asyncio.run and must keep creating its own clients.
+    """
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the shared client, if one was created."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
+
+@asynccontextmanager
+async def client_session(client: Optional[httpx.AsyncClient] = None) -> AsyncIterator[httpx.AsyncClient]:
+    """Use the given client as-is, or a fresh one closed on exit."""
+    if client is not None:
+        yield client
+        return
+    async with httpx.AsyncClient() as fresh_client:
+        yield fresh_client
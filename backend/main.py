@@ -28,6 +28,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from api.transcribe import router as transcribe_router
 from api.settings import router as settings_router
@@ -85,12 +86,19 @@ async def lifespan(app: FastAPI):
     # Shutdown
     await queue_processor.stop()
 
+    from models import async_engine
+    await async_engine.dispose()
+
+    from engines import close_shared_client
+    await close_shared_client()
+
 
 app = FastAPI(
     title="TranscribeFlow API",
     description="Local meeting transcription with speaker diarization",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -1,13 +1,25 @@
-from models.database import Base, get_db, init_db, engine, SessionLocal
+from models.database import (
+    Base,
+    get_db,
+    get_async_db,
+    init_db,
+    engine,
+    async_engine,
+    SessionLocal,
+    AsyncSessionLocal,
+)
 from models.transcription import Transcription, TranscriptionStatus
 from models.llm_operation import LLMOperation, LLMOperationStatus, LLMOperationType
 
 __all__ = [
     "Base",
     "get_db",
+    "get_async_db",
     "init_db",
     "engine",
+    "async_engine",
     "SessionLocal",
+    "AsyncSessionLocal",
     "Transcription",
     "TranscriptionStatus",
     "LLMOperation",
@@ -1,8 +1,11 @@
 # models/database.py
 """Database configuration and session management."""
 from pathlib import Path
+from typing import AsyncIterator
+
 from sqlalchemy import create_engine, text
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 DATABASE_PATH = Path.home() / ".transcribeflow" / "transcribeflow.db"
 DATABASE_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -12,11 +15,23 @@ DATABASE_URL = f"sqlite:///{DATABASE_PATH}"
 engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for request handlers, so queries run without blocking the event loop.
+# Workers and background tasks keep using the sync SessionLocal.
+async_engine = create_async_engine(f"sqlite+aiosqlite:///{DATABASE_PATH}")
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 
-def get_db():
-    """Dependency for database session."""
+async def get_db() -> AsyncIterator[Session]:
+    """Dependency for a sync database session.
+
+    Yields a blocking sync Session, not an AsyncSession: queries made with it
+    run on the event loop, and so does close() at teardown (a rollback of any
+    open transaction plus returning the SQLite connection to the pool). The
+    generator is async only to skip FastAPI's threadpool hop. New async
+    handlers should prefer get_async_db.
+    """
     db = SessionLocal()
     try:
         yield db
@@ -24,11 +39,22 @@ def get_db():
         db.close()
 
 
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """Dependency for an async database session."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def init_db():
     """Initialize database tables."""
     Base.metadata.create_all(bind=engine)
 
     with engine.begin() as conn:
+        # create_all skips tables that already exist, including their new indexes
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+
         columns = {
             row[1]
             for row in conn.execute(text("PRAGMA table_info(transcriptions)"))
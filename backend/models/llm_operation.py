@@ -3,7 +3,7 @@
 import enum
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Float, Integer, Enum, DateTime, Text, ForeignKey
+from sqlalchemy import Column, String, Float, Integer, Enum, DateTime, Text, ForeignKey, Index
 from models.database import Base
 
 
@@ -23,6 +23,10 @@ class LLMOperationType(enum.Enum):
 class LLMOperation(Base):
     """LLM post-processing operation model."""
     __tablename__ = "llm_operations"
+    __table_args__ = (
+        # Backs history listing: filter by transcription, newest first, keyset on id
+        Index("ix_llm_op_tx_created", "transcription_id", "created_at", "id"),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     transcription_id = Column(String(36), ForeignKey("transcriptions.id"), nullable=False)
@@ -3,7 +3,7 @@
 import enum
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, Float, Enum, DateTime, Text, JSON
+from sqlalchemy import Column, String, Integer, Float, Enum, DateTime, Text, JSON, Index
 from models.database import Base
 
 
@@ -20,6 +20,12 @@ class TranscriptionStatus(enum.Enum):
 class Transcription(Base):
     """Transcription task model."""
     __tablename__ = "transcriptions"
+    __table_args__ = (
+        # Backs the queue listing: newest first, keyset on id
+        Index("ix_transcriptions_created", "created_at", "id"),
+        # Status lookups: the queue processor, start-all and history cleanup
+        Index("ix_transcriptions_status", "status"),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     filename = Column(String(255), nullable=False)
@@ -5,6 +5,8 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 from functools import lru_cache
 
+from services.json_files import write_json_atomic
+
 CONFIG_PATH = Path.home() / ".transcribeflow" / "config.json"
 
 
@@ -22,8 +24,7 @@ def _load_config_file() -> Dict[str, Any]:
 def save_config(config: Dict[str, Any]) -> None:
     """Save config to JSON file."""
     CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-        json.dump(config, f, indent=2, ensure_ascii=False)
+    write_json_atomic(CONFIG_PATH, config)
     # Clear cache so new values are picked up
     get_config_value.cache_clear()
 
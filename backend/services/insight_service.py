@@ -3,21 +3,47 @@
 import json
 import logging
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
-from sqlalchemy.orm import Session
+import orjson
+from sqlalchemy.orm import Session, load_only
 
-from config import get_settings
+from config import Settings, get_settings
 from models import Transcription, LLMOperation, LLMOperationStatus, LLMOperationType
-from services.insight_template_service import InsightTemplateService, InsightTemplate
-from services.llm_models_service import LLMModelsService
+from services.insight_template_service import InsightTemplate, get_insight_template_service
+from services.llm_models_service import get_llm_models_service
 from services.llm_providers import GeminiClient, OpenRouterClient
 
 logger = logging.getLogger(__name__)
 
+# Source availability is cached per transcription for this many seconds.
+# Writers of transcript files call invalidate_source_cache() so new files
+# show up immediately; the TTL only bounds staleness for outside changes.
+SOURCE_CACHE_TTL = 10
+SOURCE_CACHE_MAX_ENTRIES = 1024
+
+# transcription_id -> (checked_at, output_dir, sources, sources_json), least recently used first
+_source_cache: "OrderedDict[str, Tuple[float, str, Dict[str, bool], bytes]]" = OrderedDict()
+
+
+def invalidate_source_cache(transcription_id: str):
+    """Forget cached source availability for a transcription."""
+    _source_cache.pop(transcription_id, None)
+
+
+def get_cached_sources_json(transcription_id: str) -> Optional[bytes]:
+    """Return the serialized source availability if a fresh entry is cached."""
+    cached = _source_cache.get(transcription_id)
+    if cached and time.monotonic() - cached[0] < SOURCE_CACHE_TTL:
+        _source_cache.move_to_end(transcription_id)
+        return cached[3]
+    return None
+
 
 @dataclass
 class InsightResult:
@@ -31,6 +57,14 @@ class InsightResult:
     processing_time_seconds: float
 
 
+@dataclass
+class InsightPreflight:
+    """Everything needed to validate and start an insights request."""
+    transcription: Optional[Transcription]
+    template: Optional[InsightTemplate]
+    sources: Dict[str, bool]
+
+
 def _format_timestamp(seconds: float) -> str:
     """Format timestamp as HH:MM:SS."""
     hours, remainder = divmod(int(seconds), 3600)
@@ -42,9 +76,13 @@ class InsightService:
     """Service for extracting AI Insights from transcripts."""
 
     def __init__(self):
-        self.settings = get_settings()
-        self.template_service = InsightTemplateService()
-        self.models_service = LLMModelsService()
+        self.template_service = get_insight_template_service()
+        self.models_service = get_llm_models_service()
+
+    @property
+    def settings(self) -> Settings:
+        """Current settings (looked up each time so a shared instance sees updates)."""
+        return get_settings()
 
     def _get_client(self, provider: str):
         """Get LLM client for provider."""
@@ -82,15 +120,13 @@ class InsightService:
         if source == "cleaned":
             cleaned_path = output_dir / "transcript_cleaned.json"
             if cleaned_path.exists():
-                with open(cleaned_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                return orjson.loads(cleaned_path.read_bytes())
             raise FileNotFoundError("Cleaned transcript not found")
 
         # Default to original
         transcript_path = output_dir / "transcript.json"
         if transcript_path.exists():
-            with open(transcript_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return orjson.loads(transcript_path.read_bytes())
         raise FileNotFoundError("Original transcript not found")
 
     async def generate_insights(
@@ -410,13 +446,68 @@ TRANSCRIPT:
 
         return sorted(insights, key=lambda x: x["created_at"], reverse=True)
 
+    def preflight(
+        self,
+        db: Session,
+        transcription_id: str,
+        template_id: str,
+    ) -> InsightPreflight:
+        """Gather transcription, template and source availability in one pass.
+
+        Loads only the transcription columns needed for validation; callers
+        decide which missing pieces are errors.
+        """
+        transcription = db.get(
+            Transcription,
+            transcription_id,
+            options=[load_only(Transcription.status, Transcription.output_dir)],
+        )
+
+        if transcription and transcription.output_dir:
+            sources = self.check_source_available(transcription)
+        else:
+            sources = {"original": False, "cleaned": False}
+
+        return InsightPreflight(
+            transcription=transcription,
+            template=self.template_service.get_template(template_id),
+            sources=sources,
+        )
+
     def check_source_available(
         self,
         transcription: Transcription
     ) -> Dict[str, bool]:
         """Check which sources are available for insights."""
+        cached = _source_cache.get(transcription.id)
+        if (
+            cached
+            and cached[1] == transcription.output_dir
+            and time.monotonic() - cached[0] < SOURCE_CACHE_TTL
+        ):
+            _source_cache.move_to_end(transcription.id)
+            return dict(cached[2])
+
         output_dir = Path(transcription.output_dir)
-        return {
+        sources = {
             "original": (output_dir / "transcript.json").exists(),
             "cleaned": (output_dir / "transcript_cleaned.json").exists(),
         }
+        _source_cache[transcription.id] = (
+            time.monotonic(), transcription.output_dir, sources, orjson.dumps(sources)
+        )
+        _source_cache.move_to_end(transcription.id)
+        if len(_source_cache) > SOURCE_CACHE_MAX_ENTRIES:
+            _source_cache.popitem(last=False)
+        return dict(sources)
+
+    def check_source_available_json(self, transcription: Transcription) -> bytes:
+        """Serialized form of check_source_available()."""
+        self.check_source_available(transcription)
+        return _source_cache[transcription.id][3]
+
+
+@lru_cache(maxsize=1)
+def get_insight_service() -> InsightService:
+    """Get shared insight service instance."""
+    return InsightService()
@@ -1,11 +1,15 @@
 # services/insight_template_service.py
 """Insight template management service for Level 2 post-processing."""
 import json
+import time
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any
 
-from config import get_settings
+import orjson
+
+from config import TEMPLATE_CACHE_TTL, get_settings
 
 
 @dataclass
@@ -19,6 +23,30 @@ class InsightTemplate:
     system_prompt: str
     temperature: float
 
+    def _summary(self) -> Dict[str, Any]:
+        """Template fields exposed by the API, without the system prompt."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "description": self.description,
+            "include_mindmap": self.include_mindmap,
+            "sections": [
+                {"id": s["id"], "title": s["title"], "description": s["description"]}
+                for s in self.sections
+            ],
+            "temperature": self.temperature,
+        }
+
+    @cached_property
+    def response_json(self) -> bytes:
+        """Serialized summary; templates are replaced, not mutated, on reload."""
+        return orjson.dumps(self._summary())
+
+    @cached_property
+    def detail_json(self) -> bytes:
+        """Serialized summary plus system prompt."""
+        return orjson.dumps({**self._summary(), "system_prompt": self.system_prompt})
+
 
 # Baseline system prompt for insights extraction
 INSIGHTS_BASELINE_PROMPT = """You are an expert meeting analyst. Your task is to extract structured insights from a meeting transcript.
@@ -280,6 +308,11 @@ class InsightTemplateService:
         else:
             self.templates_path = templates_path
 
+        self._templates: Optional[Dict[str, InsightTemplate]] = None
+        self._loaded_at = 0.0
+        # Bumped on every reload so callers can key derived caches on it
+        self._generation = 0
+
         self._ensure_defaults()
 
     def _build_system_prompt(self, template: InsightTemplate) -> str:
@@ -342,30 +375,53 @@ class InsightTemplateService:
         except (json.JSONDecodeError, KeyError, IOError):
             return None
 
+    def _get_templates(self) -> Dict[str, InsightTemplate]:
+        """Get all templates keyed by ID, reloading from disk when the cache expires."""
+        if self._templates is None or time.monotonic() - self._loaded_at > TEMPLATE_CACHE_TTL:
+            templates = {}
+            for template_file in self.templates_path.glob("*.json"):
+                template = self._load_template(template_file)
+                if template:
+                    templates[template_file.stem] = template
+            self._templates = templates
+            self._loaded_at = time.monotonic()
+            self._generation += 1
+        return self._templates
+
+    @property
+    def generation(self) -> int:
+        """Cache generation, reloading first if the cache has expired."""
+        self._get_templates()
+        return self._generation
+
+    def invalidate_cache(self):
+        """Drop cached templates so the next lookup re-reads them from disk."""
+        self._templates = None
+
+    def iter_templates(self) -> Iterator[InsightTemplate]:
+        """Iterate over insight templates in name order."""
+        templates = self._get_templates()
+        for template_id in sorted(templates, key=lambda key: templates[key].name):
+            yield templates[template_id]
+
     def list_templates(self) -> List[InsightTemplate]:
         """List all available insight templates."""
-        templates = []
-        for template_file in self.templates_path.glob("*.json"):
-            template = self._load_template(template_file)
-            if template:
-                templates.append(template)
-        return sorted(templates, key=lambda t: t.name)
+        return list(self.iter_templates())
 
     def get_template(self, template_id: str) -> Optional[InsightTemplate]:
         """Get a template by ID."""
-        template_file = self.templates_path / f"{template_id}.json"
-        if template_file.exists():
-            return self._load_template(template_file)
-        return None
+        return self._get_templates().get(template_id)
 
     def create_template(self, template: InsightTemplate) -> InsightTemplate:
         """Create a new template."""
         self._save_template(template)
+        self.invalidate_cache()
         return template
 
     def update_template(self, template: InsightTemplate) -> InsightTemplate:
         """Update an existing template."""
         self._save_template(template)
+        self.invalidate_cache()
         return template
 
     def delete_template(self, template_id: str) -> bool:
@@ -376,5 +432,12 @@ class InsightTemplateService:
         template_file = self.templates_path / f"{template_id}.json"
         if template_file.exists():
             template_file.unlink()
+            self.invalidate_cache()
             return True
         return False
+
+
+@lru_cache(maxsize=1)
+def get_insight_template_service() -> InsightTemplateService:
+    """Get shared insight template service instance."""
+    return InsightTemplateService()
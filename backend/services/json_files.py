@@ -0,0 +1,18 @@
+# services/json_files.py
+"""JSON file helpers shared by the API and services."""
+import os
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+
+def write_json_atomic(path: Path, data: Any):
+    """Write data as indented JSON, replacing the file atomically.
+
+    The bytes go to a .tmp sibling first, so a crash mid-write never leaves
+    a truncated file behind.
+    """
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_path, path)
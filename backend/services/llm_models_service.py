@@ -2,9 +2,12 @@
 """LLM models configuration service."""
 import json
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from services.json_files import write_json_atomic
+
 CONFIG_PATH = Path.home() / ".transcribeflow" / "llm_models.json"
 
 
@@ -85,8 +88,7 @@ class LLMModelsService:
 
     def _save_config(self, config: dict):
         """Save config to file."""
-        with open(self.config_path, "w", encoding="utf-8") as f:
-            json.dump(config, f, ensure_ascii=False, indent=2)
+        write_json_atomic(self.config_path, config)
 
     def _load_config(self) -> dict:
         """Load config from file."""
@@ -127,3 +129,9 @@ class LLMModelsService:
     def update_config(self, config: dict):
         """Update full configuration."""
         self._save_config(config)
+
+
+@lru_cache(maxsize=1)
+def get_llm_models_service() -> LLMModelsService:
+    """Get shared LLM models service instance."""
+    return LLMModelsService()
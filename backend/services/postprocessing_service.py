@@ -8,12 +8,15 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 
+import orjson
 from sqlalchemy.orm import Session
 
 from config import get_settings
 from models import Transcription, LLMOperation, LLMOperationStatus
-from services.template_service import TemplateService, Template
-from services.llm_models_service import LLMModelsService
+from services.insight_service import invalidate_source_cache
+from services.json_files import write_json_atomic
+from services.template_service import Template, get_template_service
+from services.llm_models_service import get_llm_models_service
 from services.llm_providers import GeminiClient, OpenRouterClient, LLMResponse
 
 logger = logging.getLogger(__name__)
@@ -121,8 +124,8 @@ class PostProcessingService:
 
     def __init__(self):
         self.settings = get_settings()
-        self.template_service = TemplateService()
-        self.models_service = LLMModelsService()
+        self.template_service = get_template_service()
+        self.models_service = get_llm_models_service()
 
     def _get_client(self, provider: str):
         """Get LLM client for provider."""
@@ -156,7 +159,8 @@ class PostProcessingService:
             provider: LLM provider (default from settings)
             model: LLM model (default from settings)
             db: Database session for logging operation
-            existing_operation: Optional existing operation to update (instead of creating new)
+            existing_operation: Optional existing operation to update (instead of creating new);
+                the caller commits it together with its final status
 
         Returns:
             PostProcessingResult with cleaned segments and usage stats
@@ -177,8 +181,7 @@ class PostProcessingService:
         if not transcript_path.exists():
             raise FileNotFoundError("Original transcript not found")
 
-        with open(transcript_path, "r", encoding="utf-8") as f:
-            transcript_data = json.load(f)
+        transcript_data = orjson.loads(transcript_path.read_bytes())
 
         segments = transcript_data.get("segments", [])
         if not segments:
@@ -245,8 +248,7 @@ TRANSCRIPT:
                 existing_operation.output_tokens = llm_response.output_tokens
                 existing_operation.cost_usd = cost_usd
                 existing_operation.temperature = template.temperature
-                # Note: status and processing_time will be set by caller
-                db.commit()
+                # Note: status and processing_time will be set and committed by caller
             else:
                 # Create new operation (legacy path)
                 operation = LLMOperation(
@@ -291,7 +293,8 @@ TRANSCRIPT:
             provider: LLM provider (default from settings)
             model: LLM model (default from settings)
             db: Database session for logging operation
-            existing_operation: Optional existing operation to update
+            existing_operation: Optional existing operation to update; the caller
+                commits it together with its final status
 
         Returns:
             List of SpeakerSuggestion
@@ -307,12 +310,10 @@ TRANSCRIPT:
         transcript_path = output_dir / "transcript.json"
 
         if cleaned_path.exists():
-            with open(cleaned_path, "r", encoding="utf-8") as f:
-                transcript_data = json.load(f)
+            transcript_data = orjson.loads(cleaned_path.read_bytes())
             segments = transcript_data.get("segments", [])
         elif transcript_path.exists():
-            with open(transcript_path, "r", encoding="utf-8") as f:
-                transcript_data = json.load(f)
+            transcript_data = orjson.loads(transcript_path.read_bytes())
             segments = transcript_data.get("segments", [])
         else:
             raise FileNotFoundError("No transcript found")
@@ -377,8 +378,7 @@ TRANSCRIPT:
                     for s in suggestions
                 ]
             }
-            with open(suggestions_path, "w", encoding="utf-8") as f:
-                json.dump(suggestions_data, f, ensure_ascii=False, indent=2)
+            write_json_atomic(suggestions_path, suggestions_data)
 
         # Log operation to database
         if db:
@@ -387,7 +387,6 @@ TRANSCRIPT:
                 existing_operation.output_tokens = llm_response.output_tokens
                 existing_operation.cost_usd = cost_usd
                 existing_operation.temperature = 0.2
-                db.commit()
             else:
                 operation = LLMOperation(
                     transcription_id=transcription.id,
@@ -549,8 +548,8 @@ TRANSCRIPT:
 
         # Save transcript_cleaned.json
         json_path = output_dir / "transcript_cleaned.json"
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(cleaned_data, f, ensure_ascii=False, indent=2)
+        write_json_atomic(json_path, cleaned_data)
+        invalidate_source_cache(transcription.id)
 
         # Save transcript_cleaned.txt
         txt_path = output_dir / "transcript_cleaned.txt"
@@ -579,8 +578,7 @@ TRANSCRIPT:
                     for s in speaker_suggestions
                 ]
             }
-            with open(suggestions_path, "w", encoding="utf-8") as f:
-                json.dump(suggestions_data, f, ensure_ascii=False, indent=2)
+            write_json_atomic(suggestions_path, suggestions_data)
 
         # Append to postprocessing_log.json
         log_path = output_dir / "postprocessing_log.json"
@@ -606,8 +604,7 @@ TRANSCRIPT:
             "status": "success",
         })
 
-        with open(log_path, "w", encoding="utf-8") as f:
-            json.dump(log_data, f, ensure_ascii=False, indent=2)
+        write_json_atomic(log_path, log_data)
 
     def _format_cleaned_txt(self, data: dict) -> str:
         """Format cleaned transcript as human-readable text."""
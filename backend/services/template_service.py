@@ -1,11 +1,13 @@
 # services/template_service.py
 """Template management service for post-processing."""
 import json
+import time
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from config import get_settings
+from config import TEMPLATE_CACHE_TTL, get_settings
 
 
 @dataclass
@@ -240,6 +242,9 @@ class TemplateService:
         else:
             self.templates_path = templates_path
 
+        self._templates: Optional[Dict[str, Template]] = None
+        self._loaded_at = 0.0
+
         self._ensure_defaults()
 
     def _ensure_defaults(self):
@@ -278,30 +283,40 @@ class TemplateService:
         except (json.JSONDecodeError, KeyError, IOError):
             return None
 
+    def _get_templates(self) -> Dict[str, Template]:
+        """Get all templates keyed by ID, reloading from disk when the cache expires."""
+        if self._templates is None or time.monotonic() - self._loaded_at > TEMPLATE_CACHE_TTL:
+            templates = {}
+            for template_file in self.templates_path.glob("*.json"):
+                template = self._load_template(template_file)
+                if template:
+                    templates[template_file.stem] = template
+            self._templates = templates
+            self._loaded_at = time.monotonic()
+        return self._templates
+
+    def invalidate_cache(self):
+        """Drop cached templates so the next lookup re-reads them from disk."""
+        self._templates = None
+
     def list_templates(self) -> List[Template]:
         """List all available templates."""
-        templates = []
-        for template_file in self.templates_path.glob("*.json"):
-            template = self._load_template(template_file)
-            if template:
-                templates.append(template)
-        return sorted(templates, key=lambda t: t.name)
+        return sorted(self._get_templates().values(), key=lambda t: t.name)
 
     def get_template(self, template_id: str) -> Optional[Template]:
         """Get a template by ID."""
-        template_file = self.templates_path / f"{template_id}.json"
-        if template_file.exists():
-            return self._load_template(template_file)
-        return None
+        return self._get_templates().get(template_id)
 
     def create_template(self, template: Template) -> Template:
         """Create a new template."""
         self._save_template(template)
+        self.invalidate_cache()
         return template
 
     def update_template(self, template: Template) -> Template:
         """Update an existing template."""
         self._save_template(template)
+        self.invalidate_cache()
         return template
 
     def delete_template(self, template_id: str) -> bool:
@@ -313,5 +328,12 @@ class TemplateService:
         template_file = self.templates_path / f"{template_id}.json"
         if template_file.exists():
             template_file.unlink()
+            self.invalidate_cache()
             return True
         return False
+
+
+@lru_cache(maxsize=1)
+def get_template_service() -> TemplateService:
+    """Get shared template service instance."""
+    return TemplateService()
@@ -65,3 +65,32 @@ def test_get_engine_models_not_found():
     """Test 404 for unknown engine models."""
     response = client.get("/api/engines/unknown-engine/models")
     assert response.status_code == 404
+
+
+def test_engine_capabilities_not_modified():
+    """Capabilities should return 304 when the client's ETag is current."""
+    response = client.get("/api/engines/mlx-whisper/capabilities")
+    etag = response.headers["etag"]
+
+    cached = client.get(
+        "/api/engines/mlx-whisper/capabilities",
+        headers={"If-None-Match": etag},
+    )
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+
+def test_get_engine_info():
+    """Info endpoint should combine models and capabilities."""
+    response = client.get("/api/engines/mlx-whisper/info")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["name"] == "mlx-whisper"
+    assert "large-v3-turbo" in data["models"]
+    assert data["capabilities"]["supports_initial_prompt"] is True
+
+
+def test_get_engine_info_not_found():
+    """Test 404 for unknown engine info."""
+    response = client.get("/api/engines/unknown-engine/info")
+    assert response.status_code == 404
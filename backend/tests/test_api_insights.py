@@ -37,3 +37,24 @@ def test_get_nonexistent_insight_template():
     """Test getting a nonexistent template returns 404."""
     response = client.get("/api/insights/templates/nonexistent")
     assert response.status_code == 404
+
+
+def test_list_insight_templates_not_modified():
+    """Template list should return 304 when the client's ETag is current."""
+    response = client.get("/api/insights/templates")
+    etag = response.headers["etag"]
+
+    cached = client.get("/api/insights/templates", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+
+
+def test_fast_sources_not_found():
+    """Fast sources path returns 404 for unknown transcriptions."""
+    response = client.get("/api/insights/fast/sources/nonexistent-id")
+    assert response.status_code == 404
+
+
+def test_fast_sources_hidden_from_schema():
+    """Fast sources path is not part of the OpenAPI schema."""
+    paths = client.get("/openapi.json").json()["paths"]
+    assert "/api/insights/fast/sources/{transcription_id}" not in paths
@@ -1,8 +1,11 @@
 # tests/test_api_postprocess.py
 """Tests for post-processing API endpoints."""
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 from main import app
+from models import SessionLocal, Transcription, TranscriptionStatus, LLMOperation, LLMOperationStatus
 
 client = TestClient(app)
 
@@ -49,3 +52,253 @@ def test_list_llm_models():
     assert "gemini" in data
     assert "openrouter" in data
     assert len(data["gemini"]["models"]) >= 3
+
+
+def test_list_templates_not_modified():
+    """Template list honours If-None-Match with a 304."""
+    response = client.get("/api/postprocess/templates")
+    etag = response.headers["etag"]
+
+    cached = client.get("/api/postprocess/templates", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+
+
+def test_clear_cached_responses_by_namespace():
+    """Clearing a namespace leaves other cached responses in place."""
+    from api.postprocess import _cache_response, _clear_cached_responses, _get_cached_response
+
+    _cache_response("templates", "cache-test", {"id": "cache-test"}, 60)
+    _cache_response("models", "cache-test", {}, 60)
+    _clear_cached_responses("templates")
+
+    assert _get_cached_response("templates", "cache-test") is None
+    assert _get_cached_response("models", "cache-test") is not None
+    _clear_cached_responses("models")
+
+
+@pytest.fixture
+def transcription_with_files(tmp_path):
+    """Completed transcription whose output directory holds post-processing files."""
+    speakers = {"SPEAKER_00": {"name": None}}
+    segments = [{"start": 0.0, "end": 1.0, "speaker": "SPEAKER_00", "text": "Hello"}]
+    (tmp_path / "transcript.json").write_text(
+        json.dumps({"metadata": {}, "speakers": speakers, "segments": segments})
+    )
+    (tmp_path / "transcript_cleaned.json").write_text(
+        json.dumps({"metadata": {}, "speakers": speakers, "segments": segments, "stats": {}})
+    )
+    (tmp_path / "speaker_suggestions.json").write_text(json.dumps({
+        "created_at": "2026-01-01T00:00:00",
+        "template": "it-meeting",
+        "model": "test-model",
+        "suggestions": [{
+            "speaker_id": "SPEAKER_00",
+            "display_name": "Anna",
+            "name": "Anna",
+            "name_confidence": 0.9,
+            "name_reason": None,
+            "role": None,
+            "role_confidence": 0.0,
+            "role_reason": None,
+            "applied": False,
+        }],
+    }))
+
+    db = SessionLocal()
+    try:
+        transcription = Transcription(
+            filename="postprocess_test.mp3",
+            original_path=str(tmp_path / "postprocess_test.mp3"),
+            output_dir=str(tmp_path),
+            status=TranscriptionStatus.COMPLETED,
+        )
+        db.add(transcription)
+        db.commit()
+        transcription_id = transcription.id
+    finally:
+        db.close()
+
+    return transcription_id, tmp_path
+
+
+def test_get_cleaned_transcript_not_modified(transcription_with_files):
+    """Cleaned transcript is served from disk with an ETag and honours If-None-Match."""
+    transcription_id, _ = transcription_with_files
+    url = f"/api/postprocess/transcriptions/{transcription_id}/cleaned"
+
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.json()["segments"][0]["text"] == "Hello"
+
+    cached = client.get(url, headers={"If-None-Match": response.headers["etag"]})
+    assert cached.status_code == 304
+
+
+def test_apply_all_speaker_suggestions(transcription_with_files):
+    """Applying all suggestions renames speakers once and leaves no temp files."""
+    transcription_id, output_dir = transcription_with_files
+    url = f"/api/postprocess/transcriptions/{transcription_id}/suggestions/apply-all"
+
+    response = client.post(url)
+    assert response.status_code == 200
+    assert response.json()["applied"] == 1
+
+    transcript = json.loads((output_dir / "transcript.json").read_text())
+    assert transcript["speakers"]["SPEAKER_00"]["name"] == "Anna"
+    assert not list(output_dir.glob("*.tmp"))
+    assert "Anna" in (output_dir / "transcript.txt").read_text()
+
+    assert client.post(url).json()["applied"] == 0
+
+
+def test_apply_speaker_suggestion_persists_speaker_names(transcription_with_files):
+    """Applying a suggestion adds to existing speaker names in the database."""
+    transcription_id, _ = transcription_with_files
+
+    db = SessionLocal()
+    try:
+        db.get(Transcription, transcription_id).speaker_names = {"SPEAKER_01": "Boris"}
+        db.commit()
+    finally:
+        db.close()
+
+    response = client.post(
+        f"/api/postprocess/transcriptions/{transcription_id}/suggestions/SPEAKER_00/apply"
+    )
+    assert response.status_code == 200
+
+    db = SessionLocal()
+    try:
+        speaker_names = db.get(Transcription, transcription_id).speaker_names
+    finally:
+        db.close()
+    assert speaker_names == {"SPEAKER_01": "Boris", "SPEAKER_00": "Anna"}
+
+
+def test_list_operations_keyset_pagination(transcription_with_files):
+    """Operation history pages through X-Next-Cursor without repeats."""
+    transcription_id, _ = transcription_with_files
+
+    db = SessionLocal()
+    try:
+        for _ in range(3):
+            db.add(LLMOperation(
+                transcription_id=transcription_id,
+                provider="gemini",
+                model="test-model",
+                template_id="it-meeting",
+                temperature=0.2,
+                input_tokens=0,
+                output_tokens=0,
+                processing_time_seconds=0,
+                status=LLMOperationStatus.SUCCESS,
+            ))
+        db.commit()
+    finally:
+        db.close()
+
+    url = f"/api/postprocess/operations?transcription_id={transcription_id}&limit=2"
+    first = client.get(url)
+    assert len(first.json()) == 2
+
+    second = client.get(url, params={"cursor": first.headers["x-next-cursor"]})
+    assert len(second.json()) == 1
+    assert "x-next-cursor" not in second.headers
+
+    ids = [op["id"] for op in first.json() + second.json()]
+    assert len(set(ids)) == 3
+
+
+def test_list_operations_invalid_cursor():
+    """A malformed cursor is rejected."""
+    response = client.get("/api/postprocess/operations", params={"cursor": "bogus"})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_run_postprocessing_reloads_transcription():
+    """The background task loads the row itself and fails cleanly if it is gone."""
+    import uuid
+    from api.postprocess import _run_postprocessing
+
+    transcription_id = str(uuid.uuid4())  # never inserted
+    await _run_postprocessing(transcription_id, "it-meeting", "gemini", "test-model")
+
+    db = SessionLocal()
+    try:
+        operation = db.query(LLMOperation).filter(
+            LLMOperation.transcription_id == transcription_id
+        ).one()
+        assert operation.status == LLMOperationStatus.FAILED
+        assert "not found" in operation.error_message
+    finally:
+        db.close()
+
+
+@pytest.mark.asyncio
+async def test_run_identify_speakers_records_failure():
+    """A failed speaker identification is stored with a bounded error message."""
+    import uuid
+    from api.postprocess import _run_identify_speakers
+
+    transcription_id = str(uuid.uuid4())  # never inserted
+    await _run_identify_speakers(transcription_id, "gemini", "test-model")
+
+    db = SessionLocal()
+    try:
+        operation = db.query(LLMOperation).filter(
+            LLMOperation.transcription_id == transcription_id
+        ).one()
+        assert operation.template_id == "identify-speakers"
+        assert operation.status == LLMOperationStatus.FAILED
+        assert "not found" in operation.error_message
+    finally:
+        db.close()
+
+
+def test_apply_all_rejects_concurrent_apply(transcription_with_files):
+    """A second apply-all for the same transcription is refused while one runs."""
+    from api.postprocess import _claim_job, _release_job
+
+    transcription_id, _ = transcription_with_files
+    url = f"/api/postprocess/transcriptions/{transcription_id}/suggestions/apply-all"
+
+    _claim_job("apply-suggestions", transcription_id, "Apply already in progress")
+    try:
+        assert client.post(url).status_code == 409
+    finally:
+        _release_job("apply-suggestions", transcription_id)
+
+    assert client.post(url).status_code == 200
+
+
+def test_stale_job_claim_is_replaced(monkeypatch):
+    """A claim whose task never released it stops blocking once it is stale."""
+    from fastapi import HTTPException
+    from api import postprocess
+
+    postprocess._claim_job("postprocess", "stale-claim", "busy")
+    try:
+        with pytest.raises(HTTPException):
+            postprocess._claim_job("postprocess", "stale-claim", "busy")
+
+        monkeypatch.setattr(postprocess, "JOB_CLAIM_TIMEOUT", 0)
+        postprocess._claim_job("postprocess", "stale-claim", "busy")
+    finally:
+        postprocess._release_job("postprocess", "stale-claim")
+
+
+def test_apply_suggestion_shares_apply_all_claim(transcription_with_files):
+    """A single apply is refused while an apply-all holds the transcription."""
+    from api.postprocess import _claim_job, _release_job
+
+    transcription_id, _ = transcription_with_files
+    url = f"/api/postprocess/transcriptions/{transcription_id}/suggestions/SPEAKER_00/apply"
+
+    _claim_job("apply-suggestions", transcription_id, "Apply already in progress")
+    try:
+        assert client.post(url).status_code == 409
+    finally:
+        _release_job("apply-suggestions", transcription_id)
+
+    assert client.post(url).status_code == 200
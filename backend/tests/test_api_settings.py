@@ -0,0 +1,95 @@
+# tests/test_api_settings.py
+"""Tests for Settings API endpoints."""
+import json
+
+from fastapi.testclient import TestClient
+
+from api import settings as settings_api
+from config import clear_settings_cache, get_settings
+from main import app
+
+
+client = TestClient(app)
+
+
+def test_get_settings_hides_api_keys():
+    """Settings expose key presence flags, never the keys themselves."""
+    response = client.get("/api/settings")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+
+    data = response.json()
+    assert "has_hf_token" in data
+    assert "hf_token" not in data
+    assert "features" in data
+
+
+def test_get_settings_not_modified():
+    """Settings honour If-None-Match with a 304 and always revalidate."""
+    response = client.get("/api/settings")
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == "public, max-age=0"
+
+    cached = client.get("/api/settings", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+
+def test_settings_body_rebuilt_after_cache_clear():
+    """The serialized body is reused per Settings instance and rebuilt on reload."""
+    first, _ = settings_api._settings_response_body(get_settings())
+    assert settings_api._settings_response_body(get_settings())[0] is first
+
+    clear_settings_cache()
+    rebuilt, _ = settings_api._settings_response_body(get_settings())
+    assert rebuilt is not first
+    assert rebuilt == first
+
+
+def test_build_settings_response_matches_settings():
+    """Every response field is derived from the current settings."""
+    settings = get_settings()
+    response = settings_api._build_settings_response(settings)
+
+    assert response.default_engine == settings.default_engine
+    assert response.whisper_initial_prompt == settings.whisper_initial_prompt
+    assert response.has_hf_token is bool(settings.hf_token)
+    assert response.has_openrouter_key is bool(settings.openrouter_api_key)
+    assert response.features == settings_api.FEATURES
+
+
+def test_update_settings_merges_only_provided_fields(tmp_path, monkeypatch):
+    """PUT keeps existing keys and ignores omitted, null and empty-string fields."""
+    import config
+
+    config_path = tmp_path / "config.json"
+    config_path.write_text('{"default_model": "small", "hf_token": "secret"}', encoding="utf-8")
+    monkeypatch.setattr(config, "CONFIG_PATH", config_path)
+    monkeypatch.setattr(settings_api, "CONFIG_PATH", config_path)
+    monkeypatch.setattr(settings_api.queue_processor, "reset_workers", lambda: None)
+    clear_settings_cache()
+
+    try:
+        response = client.put(
+            "/api/settings",
+            json={"default_model": "medium", "hf_token": "", "min_speakers": None},
+        )
+        assert response.status_code == 200
+
+        saved = json.loads(config_path.read_text(encoding="utf-8"))
+        assert saved == {"default_model": "medium", "hf_token": "secret"}
+        assert not config_path.with_suffix(".json.tmp").exists()
+        assert response.json()["default_model"] == "medium"
+        assert response.json() == client.get("/api/settings").json()
+    finally:
+        clear_settings_cache()
+
+
+def test_validate_key_unknown_provider():
+    """Unknown providers are reported as invalid rather than erroring."""
+    response = client.post(
+        "/api/settings/validate-key",
+        json={"provider": "nonexistent", "api_key": "key"},
+    )
+    assert response.status_code == 200
+    assert response.json() == {"valid": False, "error": "Unknown provider: nonexistent"}
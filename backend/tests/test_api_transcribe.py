@@ -1,9 +1,11 @@
 # tests/test_api_transcribe.py
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 from io import BytesIO
 from main import app
-from models import SessionLocal, Transcription, TranscriptionStatus
+from models import SessionLocal, Transcription, TranscriptionStatus, LLMOperation, LLMOperationStatus
 
 
 client = TestClient(app)
@@ -28,6 +30,7 @@ def test_upload_audio_file():
     assert "id" in data
     assert data["filename"] == "test_meeting.mp3"
     assert data["status"] == "draft"  # Changed from "queued"
+    assert data["file_size"] == len(b"fake audio content")
 
 
 def test_upload_invalid_file_type():
@@ -43,6 +46,17 @@ def test_upload_invalid_file_type():
     assert "not supported" in response.json()["detail"]
 
 
+def test_upload_rejects_path_in_filename():
+    """Test that filenames with path separators are rejected before saving."""
+    for filename in ("../escape.mp3", "nested\\escape.mp3"):
+        response = client.post(
+            "/api/transcribe/upload",
+            files={"file": (filename, BytesIO(b"fake audio"), "audio/mpeg")},
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid filename"
+
+
 def test_list_transcriptions_queue():
     """Test listing all transcriptions in queue."""
     response = client.get("/api/transcribe/queue")
@@ -52,6 +66,68 @@ def test_list_transcriptions_queue():
     assert isinstance(data, list)
 
 
+def test_list_queue_attaches_llm_operations():
+    """Test queue rows carry their own LLM operations, newest first."""
+    fake_audio = BytesIO(b"fake audio")
+    upload_response = client.post(
+        "/api/transcribe/upload",
+        files={"file": ("queue_ops_test.mp3", fake_audio, "audio/mpeg")},
+    )
+    transcription_id = upload_response.json()["id"]
+
+    db = SessionLocal()
+    try:
+        for template_id in ("it-meeting", "identify-speakers"):
+            db.add(LLMOperation(
+                transcription_id=transcription_id,
+                provider="gemini",
+                model="test-model",
+                template_id=template_id,
+                temperature=0.2,
+                input_tokens=10,
+                output_tokens=5,
+                processing_time_seconds=1.0,
+                status=LLMOperationStatus.SUCCESS,
+            ))
+            db.commit()
+    finally:
+        db.close()
+
+    response = client.get("/api/transcribe/queue", params={"limit": 1})
+    assert response.status_code == 200
+    [row] = response.json()
+    assert row["id"] == transcription_id
+    assert [op["template_id"] for op in row["llm_operations"]] == ["identify-speakers", "it-meeting"]
+
+
+def test_list_queue_keyset_pagination():
+    """Test the queue pages through X-Next-Cursor without repeats."""
+    for name in ("page_a.mp3", "page_b.mp3", "page_c.mp3"):
+        client.post(
+            "/api/transcribe/upload",
+            files={"file": (name, BytesIO(b"fake audio"), "audio/mpeg")},
+        )
+
+    first = client.get("/api/transcribe/queue", params={"limit": 2})
+    assert len(first.json()) == 2
+    cursor = first.headers["x-next-cursor"]
+
+    second = client.get("/api/transcribe/queue", params={"limit": 2, "cursor": cursor})
+    assert second.status_code == 200
+
+    first_ids = [t["id"] for t in first.json()]
+    second_ids = [t["id"] for t in second.json()]
+    assert second_ids
+    assert not set(first_ids) & set(second_ids)
+    assert first.json()[-1]["created_at"] >= second.json()[0]["created_at"]
+
+
+def test_list_queue_invalid_cursor():
+    """Test a malformed queue cursor is rejected."""
+    response = client.get("/api/transcribe/queue", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
 def test_get_transcription_by_id():
     """Test getting a specific transcription by ID."""
     # First upload a file
@@ -210,6 +286,25 @@ def test_start_transcriptions():
     assert check2.json()["status"] == "queued"
 
 
+def test_start_transcriptions_counts_failures():
+    """Test unknown and non-draft ids are counted as failed."""
+    upload_response = client.post(
+        "/api/transcribe/upload",
+        files={"file": ("start_failed_test.mp3", BytesIO(b"fake audio"), "audio/mpeg")},
+    )
+    transcription_id = upload_response.json()["id"]
+
+    first = client.post("/api/transcribe/start", json={"ids": [transcription_id]})
+    assert first.json() == {"started": 1, "failed": 0}
+
+    # Already queued, plus an id that does not exist
+    second = client.post(
+        "/api/transcribe/start",
+        json={"ids": [transcription_id, "nonexistent-id"]},
+    )
+    assert second.json() == {"started": 0, "failed": 2}
+
+
 def test_start_all_transcriptions():
     """Test starting all draft transcriptions."""
     # Upload files
@@ -252,6 +347,107 @@ def test_delete_transcription():
     assert check.status_code == 404
 
 
+def test_update_speakers_rewrites_transcript(tmp_path):
+    """Test renaming speakers updates the DB and transcript.json in place."""
+    fake_audio = BytesIO(b"fake audio")
+    upload_response = client.post(
+        "/api/transcribe/upload",
+        files={"file": ("speakers_test.mp3", fake_audio, "audio/mpeg")},
+    )
+    transcription_id = upload_response.json()["id"]
+
+    output_dir = tmp_path / "transcription-output"
+    output_dir.mkdir()
+    transcript = {
+        "metadata": {"filename": "speakers_test.mp3"},
+        "speakers": {"SPEAKER_00": {"name": "SPEAKER_00"}},
+        "segments": [{"start": 0, "speaker": "SPEAKER_00", "text": "Привет"}],
+    }
+    (output_dir / "transcript.json").write_text(json.dumps(transcript), encoding="utf-8")
+
+    db = SessionLocal()
+    try:
+        transcription = db.query(Transcription).filter(Transcription.id == transcription_id).first()
+        transcription.output_dir = str(output_dir)
+        db.commit()
+    finally:
+        db.close()
+
+    response = client.put(
+        f"/api/transcribe/{transcription_id}/speakers",
+        json={"speaker_names": {"SPEAKER_00": "Сергей"}},
+    )
+    assert response.status_code == 200
+
+    db = SessionLocal()
+    try:
+        transcription = db.query(Transcription).filter(Transcription.id == transcription_id).first()
+        assert transcription.speaker_names == {"SPEAKER_00": "Сергей"}
+    finally:
+        db.close()
+
+    saved = (output_dir / "transcript.json").read_text(encoding="utf-8")
+    assert "Сергей" in saved  # written as UTF-8, not \u escapes
+    assert json.loads(saved)["speakers"]["SPEAKER_00"]["name"] == "Сергей"
+
+    transcript_response = client.get(f"/api/transcribe/{transcription_id}/transcript")
+    assert transcript_response.json()["segments"][0]["text"] == "Привет"
+    assert transcript_response.json()["speakers"]["SPEAKER_00"]["name"] == "Сергей"
+
+    etag = transcript_response.headers["etag"]
+    cached = client.get(
+        f"/api/transcribe/{transcription_id}/transcript",
+        headers={"If-None-Match": etag},
+    )
+    assert cached.status_code == 304
+
+    # Re-sending the same names leaves the transcript untouched
+    mtime = (output_dir / "transcript.json").stat().st_mtime_ns
+    response = client.put(
+        f"/api/transcribe/{transcription_id}/speakers",
+        json={"speaker_names": {"SPEAKER_00": "Сергей"}},
+    )
+    assert response.status_code == 200
+    assert (output_dir / "transcript.json").stat().st_mtime_ns == mtime
+    assert "Сергей" in (output_dir / "transcript.txt").read_text(encoding="utf-8")
+
+
+def test_update_speakers_not_found():
+    """Test renaming speakers of an unknown transcription returns 404."""
+    response = client.put(
+        "/api/transcribe/nonexistent-id/speakers",
+        json={"speaker_names": {"SPEAKER_00": "Сергей"}},
+    )
+    assert response.status_code == 404
+
+
+def test_delete_failed_history():
+    """Test deleting failed history removes only failed transcriptions."""
+    ids = []
+    for name in ("failed_history.mp3", "kept_history.mp3"):
+        upload_response = client.post(
+            "/api/transcribe/upload",
+            files={"file": (name, BytesIO(b"fake audio"), "audio/mpeg")},
+        )
+        ids.append(upload_response.json()["id"])
+    failed_id, kept_id = ids
+
+    db = SessionLocal()
+    try:
+        transcription = db.query(Transcription).filter(Transcription.id == failed_id).first()
+        transcription.status = TranscriptionStatus.FAILED
+        db.commit()
+    finally:
+        db.close()
+
+    response = client.delete("/api/transcribe/history/failed")
+    assert response.status_code == 200
+    assert response.json()["deleted"] >= 1
+
+    assert client.get(f"/api/transcribe/{failed_id}").status_code == 404
+    assert client.get(f"/api/transcribe/{kept_id}").status_code == 200
+
+
 def test_stream_original_audio(tmp_path):
     """Test streaming original audio from completed transcription output dir."""
     fake_audio = BytesIO(b"fake audio content")
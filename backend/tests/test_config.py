@@ -84,3 +84,24 @@ def test_insights_settings_exist():
     assert hasattr(settings, 'insights_model')
     assert hasattr(settings, 'insights_default_template')
     assert hasattr(settings, 'insight_templates_path')
+
+
+def test_load_config_file_reparses_only_on_change(tmp_path, monkeypatch):
+    """Parsed config.json is reused until the file's mtime changes."""
+    import os
+    import config
+
+    config_path = tmp_path / "config.json"
+    config_path.write_text('{"default_model": "small"}', encoding="utf-8")
+    monkeypatch.setattr(config, "CONFIG_PATH", config_path)
+    monkeypatch.setattr(config, "_config_cache", None)
+
+    first = config.load_config_file()
+    assert first == {"default_model": "small"}
+    first["default_model"] = "mutated"
+    assert config.load_config_file() == {"default_model": "small"}
+
+    config_path.write_text('{"default_model": "medium"}', encoding="utf-8")
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert config.load_config_file() == {"default_model": "medium"}
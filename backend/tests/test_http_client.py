@@ -0,0 +1,36 @@
+# tests/test_http_client.py
+"""Tests for the shared engine HTTP client."""
+import pytest
+
+from engines.http_client import client_session, close_shared_client, get_shared_client
+
+
+@pytest.mark.asyncio
+async def test_shared_client_is_reused_until_closed():
+    """get_shared_client returns one client until it is closed."""
+    client = get_shared_client()
+    assert get_shared_client() is client
+
+    await close_shared_client()
+    assert client.is_closed
+    assert get_shared_client() is not client
+    await close_shared_client()
+
+
+@pytest.mark.asyncio
+async def test_client_session_uses_given_client():
+    """A passed-in client is yielded as-is and left open."""
+    client = get_shared_client()
+    async with client_session(client) as session_client:
+        assert session_client is client
+    assert not client.is_closed
+    await close_shared_client()
+
+
+@pytest.mark.asyncio
+async def test_client_session_creates_and_closes_own_client():
+    """Without a client, a fresh one is created and closed on exit."""
+    async with client_session() as session_client:
+        assert session_client is not get_shared_client()
+    assert session_client.is_closed
+    await close_shared_client()
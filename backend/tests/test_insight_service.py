@@ -56,3 +56,33 @@ def test_format_transcript_for_insights(mock_transcript_data):
     assert "[00:00:00]" in formatted
     assert "SPEAKER_00" in formatted
     assert "Hello, let's discuss" in formatted
+
+
+def test_check_source_available_cached_until_invalidated(tmp_path):
+    """Source availability is cached and refreshed after invalidation."""
+    from services.insight_service import invalidate_source_cache
+
+    (tmp_path / "transcript.json").write_text("{}")
+    transcription = MagicMock(id="cache-test", output_dir=str(tmp_path))
+    service = InsightService()
+
+    assert service.check_source_available(transcription) == {"original": True, "cleaned": False}
+
+    (tmp_path / "transcript_cleaned.json").write_text("{}")
+    assert service.check_source_available(transcription)["cleaned"] is False
+
+    invalidate_source_cache("cache-test")
+    assert service.check_source_available(transcription)["cleaned"] is True
+
+
+def test_cached_sources_json(tmp_path):
+    """Serialized source availability is served from the cache."""
+    from services.insight_service import get_cached_sources_json
+
+    (tmp_path / "transcript.json").write_text("{}")
+    transcription = MagicMock(id="json-cache-test", output_dir=str(tmp_path))
+    service = InsightService()
+
+    assert get_cached_sources_json("json-cache-test") is None
+    assert service.check_source_available_json(transcription) == b'{"original":true,"cleaned":false}'
+    assert get_cached_sources_json("json-cache-test") == b'{"original":true,"cleaned":false}'
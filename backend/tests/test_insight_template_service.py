@@ -56,3 +56,29 @@ def test_insight_template_service_get_nonexistent(tmp_path):
 
     template = service.get_template("nonexistent")
     assert template is None
+
+
+def test_insight_template_service_caches_until_changed(tmp_path):
+    """Test that templates are served from cache and refreshed on create/delete."""
+    service = InsightTemplateService(templates_path=tmp_path)
+    service.list_templates()
+    generation = service.generation
+
+    assert service.get_template("it-meeting") is not None
+    assert service.generation == generation
+
+    custom = InsightTemplate(
+        id="custom",
+        name="Custom",
+        description="Custom template",
+        include_mindmap=False,
+        sections=[],
+        system_prompt="You are a test.",
+        temperature=0.3
+    )
+    service.create_template(custom)
+    assert service.get_template("custom") is not None
+    assert service.generation > generation
+
+    assert service.delete_template("custom") is True
+    assert service.get_template("custom") is None
@@ -0,0 +1,18 @@
+# tests/test_json_files.py
+"""Tests for the shared JSON file helpers."""
+import json
+
+from services.json_files import write_json_atomic
+
+
+def test_write_json_atomic_replaces_file(tmp_path):
+    """The file is replaced in one step and no temp file is left behind."""
+    path = tmp_path / "data.json"
+    path.write_text('{"old": true}')
+
+    write_json_atomic(path, {"name": "Сергей"})
+
+    text = path.read_text(encoding="utf-8")
+    assert "Сергей" in text  # UTF-8, not \u escapes
+    assert json.loads(text) == {"name": "Сергей"}
+    assert list(tmp_path.iterdir()) == [path]
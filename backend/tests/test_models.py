@@ -106,3 +106,23 @@ def test_llm_operation_status_values():
     from models.llm_operation import LLMOperationStatus
     assert LLMOperationStatus.SUCCESS.value == "success"
     assert LLMOperationStatus.FAILED.value == "failed"
+
+
+@pytest.mark.parametrize("table, index, columns", [
+    # Operation history per transcription, newest first
+    ("llm_operations", "ix_llm_op_tx_created", ["transcription_id", "created_at", "id"]),
+    # Queue listing by creation time
+    ("transcriptions", "ix_transcriptions_created", ["created_at", "id"]),
+    # Status filters (queue processor, history cleanup)
+    ("transcriptions", "ix_transcriptions_status", ["status"]),
+])
+def test_model_indexes(table, index, columns):
+    """Hot query paths are backed by the expected indexes."""
+    from sqlalchemy import inspect
+    import models.llm_operation  # noqa: F401  registers llm_operations on Base
+
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    indexes = {i["name"]: i["column_names"] for i in inspect(engine).get_indexes(table)}
+    assert indexes[index] == columns
@@ -48,3 +48,33 @@ def test_template_dataclass():
     )
     assert template.id == "test"
     assert template.temperature == 0.5
+
+
+def test_get_template_service_is_shared():
+    """The template service accessor returns one shared instance."""
+    from services.template_service import get_template_service
+
+    assert get_template_service() is get_template_service()
+
+
+def test_template_service_caches_until_changed(tmp_path):
+    """Test that templates are served from cache and refreshed on create/delete."""
+    service = TemplateService(templates_path=tmp_path)
+    template = service.get_template("it-meeting")
+
+    (tmp_path / "it-meeting.json").unlink()
+    assert service.get_template("it-meeting") is template
+
+    custom = Template(
+        id="custom",
+        name="Custom",
+        description="Custom template",
+        system_prompt="You are a test.",
+        temperature=0.3
+    )
+    service.create_template(custom)
+    assert service.get_template("custom") is not None
+    assert service.get_template("it-meeting") is None
+
+    assert service.delete_template("custom") is True
+    assert service.get_template("custom") is None
@@ -1,7 +1,6 @@
 # workers/transcription_worker.py
 """Main transcription processing worker."""
 import gc
-import json
 import logging
 import os
 import shutil
@@ -12,6 +11,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional
 
+import orjson
 from sqlalchemy.orm import Session
 
 from config import Settings, get_settings
@@ -25,12 +25,15 @@ from engines import (
     YandexEngine,
 )
 from models import Transcription, TranscriptionStatus
+from services.insight_service import invalidate_source_cache
 # Lazy imports to avoid loading PyTorch before MLX transcription
 # from workers.diarization import DiarizationWorker
 # from workers.whisperx_diarization import WhisperXDiarizationWorker
 
 PLAYBACK_PREVIEW_FILENAME = "playback_preview.m4a"
 PLAYBACK_PREVIEW_TEMP_FILENAME = "playback_preview.tmp.m4a"
+# Pretty-printed like before; engines may hand back numpy scalars or int speaker keys
+_TRANSCRIPT_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
 
 
 class TranscriptionWorker:
@@ -468,8 +471,8 @@ class TranscriptionWorker:
 
         # Save JSON
         json_path = output_dir / "transcript.json"
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(transcript_data, f, ensure_ascii=False, indent=2)
+        json_path.write_bytes(orjson.dumps(transcript_data, option=_TRANSCRIPT_JSON_OPTIONS))
+        invalidate_source_cache(transcription.id)
 
         # Save human-readable TXT
         txt_path = output_dir / "transcript.txt"
@@ -479,8 +482,7 @@ class TranscriptionWorker:
         # Save raw API response (for cloud engines)
         if raw_response:
             raw_path = output_dir / "raw_response.json"
-            with open(raw_path, "w", encoding="utf-8") as f:
-                json.dump(raw_response, f, ensure_ascii=False, indent=2)
+            raw_path.write_bytes(orjson.dumps(raw_response, option=_TRANSCRIPT_JSON_OPTIONS))
 
     def _build_speakers_dict(self, segments: list) -> dict:
         """Build speakers dictionary with default names and colors."""
@@ -201,6 +201,10 @@ export interface EngineCapabilitiesResponse {
   capabilities: EngineCapabilities;
 }
 
+export interface EngineDetailsResponse extends EngineCapabilitiesResponse {
+  models: string[];
+}
+
 // Cache for engine capabilities
 const capabilitiesCache: Record<string, EngineCapabilities> = {};
 
@@ -209,7 +213,7 @@ export async function getEngineCapabilities(engineName: string): Promise<EngineC
     return capabilitiesCache[engineName];
   }
 
-  const response = await fetch(`${API_BASE}/api/engines/${engineName}/capabilities`);
+  const response = await fetch(`${API_BASE}/api/engines/${engineName}/info`);
   if (!response.ok) {
     // Return default capabilities if engine not found
     return {
@@ -219,7 +223,7 @@ export async function getEngineCapabilities(engineName: string): Promise<EngineC
     };
   }
 
-  const data: EngineCapabilitiesResponse = await response.json();
+  const data: EngineDetailsResponse = await response.json();
   capabilitiesCache[engineName] = data.capabilities;
   return data.capabilities;
 }